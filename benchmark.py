@@ -0,0 +1,252 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from src.utils.audio import WHISPER_SAMPLE_RATE
+
+DEFAULT_LENGTHS = "5,30,120"
+
+
+def print_header(title):
+    print("\n" + "="*60)
+    print(f" {title}")
+    print("="*60)
+
+
+def peak_rss_mb():
+    # Peak resident set size of this process so far. Each configuration runs
+    # in its own process, so this is that configuration's peak (interpreter included).
+    if os.name == "nt":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize / (1024 * 1024)
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / 1024 if sys.platform != "darwin" else peak / (1024 * 1024)
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def load_source_audio(path):
+    if path:
+        import soundfile as sf
+        from src.services.capture_format import CaptureFormat
+
+        data, rate = sf.read(path, dtype="float32", always_2d=True)
+        return CaptureFormat(rate, data.shape[1]).process(data), os.path.basename(path)
+
+    # No fixture given: amplitude-modulated tones, only useful for relative numbers
+    t = np.arange(WHISPER_SAMPLE_RATE * 60) / WHISPER_SAMPLE_RATE
+    audio = 0.2 * np.sin(2 * np.pi * 220 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 0.5 * t))
+    return audio.astype(np.float32), "synthetic"
+
+
+def make_fixtures(source, lengths):
+    # Tile or crop the source to each requested length
+    fixtures = {}
+    for seconds in lengths:
+        n = int(seconds * WHISPER_SAMPLE_RATE)
+        reps = -(-n // len(source))
+        fixtures[seconds] = np.tile(source, reps)[:n]
+    return fixtures
+
+
+def percentile(values, q):
+    return float(np.percentile(values, q)) if values else None
+
+
+def run_config(model_size, device, compute_type, cpu_threads, beam_size, fixtures, repeats):
+    from src.services.transcriber import Transcriber
+
+    t0 = time.perf_counter()
+    model = Transcriber._load_model((model_size, device, compute_type, cpu_threads, 1))
+    load_s = time.perf_counter() - t0
+    # _load_model falls back to 'default' if the requested type fails; label the row with what ran
+    loaded_type = Transcriber.loaded_compute_type(model) or compute_type
+    fallback = not Transcriber.compute_type_matches(compute_type, loaded_type)
+
+    # One untimed pass so lazy initialisation does not skew the first sample
+    list(model.transcribe(fixtures[min(fixtures)], beam_size=beam_size, language="en")[0])
+
+    results = []
+    for seconds, audio in sorted(fixtures.items()):
+        latencies = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            segments, _ = model.transcribe(audio, beam_size=beam_size, language="en")
+            list(segments)
+            latencies.append(time.perf_counter() - t0)
+
+        p50 = percentile(latencies, 50)
+        results.append({
+            "audio_seconds": seconds,
+            "latency_p50_s": p50,
+            "latency_p95_s": percentile(latencies, 95),
+            "rtf": p50 / seconds,
+            "latencies_s": latencies,
+        })
+
+    return {
+        "model": model_size,
+        "device": device,
+        "compute_type": loaded_type,
+        "requested_compute_type": compute_type,
+        "compute_type_fallback": fallback,
+        "cpu_threads": cpu_threads,
+        "beam_size": beam_size,
+        "load_s": load_s,
+        "peak_rss_mb": peak_rss_mb(),
+        "lengths": results,
+    }
+
+
+def run_isolated(config, args):
+    # Runs one configuration in a fresh interpreter so its memory peak is its own
+    fd, result_path = tempfile.mkstemp(prefix="whisper_bench_", suffix=".json")
+    os.close(fd)
+    try:
+        cmd = [sys.executable, os.path.abspath(__file__), "--lengths", args.lengths, "--repeats", str(args.repeats),
+               "--run-config", json.dumps(config), "--result-file", result_path]
+        if args.audio:
+            cmd += ["--audio", args.audio]
+        proc = subprocess.run(cmd)
+        with open(result_path, encoding="utf-8") as f:
+            text = f.read()
+        if proc.returncode != 0 or not text:
+            raise RuntimeError(f"benchmark process exited with code {proc.returncode}")
+        return json.loads(text)
+    finally:
+        os.remove(result_path)
+
+
+def run_child(args):
+    config = json.loads(args.run_config)
+    source, _ = load_source_audio(args.audio)
+    fixtures = make_fixtures(source, csv_list(args.lengths, float))
+    result = run_config(config["model"], config["device"], config["compute_type"], config["cpu_threads"],
+                        config["beam_size"], fixtures, args.repeats)
+    with open(args.result_file, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+
+
+def print_table(runs):
+    # Peak RSS covers a fresh process per configuration: interpreter, libraries and that one model
+    print(f"{'model':<8} {'compute':<13} {'thr':>4} {'beam':>4} {'len s':>6} {'load s':>7} "
+          f"{'p50 s':>7} {'p95 s':>7} {'RTF':>6} {'peak RSS MB':>11}")
+    for run in runs:
+        if "error" in run:
+            print(f"{run['model']:<8} {run['compute_type']:<13} {run['cpu_threads']:>4} "
+                  f"{run['beam_size']:>4}  FAILED: {run['error']}")
+            continue
+        compute = run['compute_type'] + ("*" if run['compute_type_fallback'] else "")
+        for r in run["lengths"]:
+            print(f"{run['model']:<8} {compute:<13} {run['cpu_threads']:>4} {run['beam_size']:>4} "
+                  f"{r['audio_seconds']:>6g} {run['load_s']:>7.2f} {r['latency_p50_s']:>7.2f} "
+                  f"{r['latency_p95_s']:>7.2f} {r['rtf']:>6.3f} {run['peak_rss_mb']:>11.0f}")
+    if any(r.get("compute_type_fallback") for r in runs):
+        print("* requested compute type failed to load, the row shows the type that did")
+
+
+def csv_list(value, cast=str):
+    return [cast(v.strip()) for v in value.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the local Whisper backend.")
+    parser.add_argument("--audio", help="Fixture audio file (any format soundfile reads). Tiled/cropped to each length.")
+    parser.add_argument("--lengths", default=DEFAULT_LENGTHS, help="Audio lengths in seconds (default: %(default)s)")
+    parser.add_argument("--models", default="tiny,base", help="Model sizes (default: %(default)s)")
+    parser.add_argument("--compute-types", default=None, help="Compute types (default: int8 on CPU, float16 on CUDA)")
+    parser.add_argument("--beam-sizes", default="1,5", help="Beam sizes (default: %(default)s)")
+    parser.add_argument("--cpu-threads", default="0", help="CPU thread counts, 0 = CTranslate2 default (default: %(default)s)")
+    parser.add_argument("--device", default=None, help="cpu or cuda (default: auto)")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per length (default: %(default)s)")
+    parser.add_argument("--json", dest="json_path", help="Write results as JSON to this file")
+    # Internal: run a single configuration (used for the per-configuration subprocesses)
+    parser.add_argument("--run-config", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_config:
+        run_child(args)
+        return
+
+    from src.services.transcriber import Transcriber
+
+    if args.device:
+        device = args.device
+        default_compute = "float16" if device == "cuda" else "int8"
+    else:
+        device, default_compute = Transcriber._detect_device()
+    compute_types = csv_list(args.compute_types) if args.compute_types else [default_compute]
+
+    if not args.audio:
+        print("No --audio given, using synthetic audio. Results are not representative of speech.")
+    source_name = os.path.basename(args.audio) if args.audio else "synthetic"
+
+    print_header("BENCHMARK")
+    print(f"Commit: {git_commit()}  Device: {device}  Audio: {source_name}")
+
+    runs = []
+    sweep = itertools.product(csv_list(args.models), compute_types, csv_list(args.cpu_threads, int),
+                              csv_list(args.beam_sizes, int))
+    for model_size, compute_type, cpu_threads, beam_size in sweep:
+        print(f"\n-> {model_size} {compute_type} threads={cpu_threads} beam={beam_size}", flush=True)
+        config = {"model": model_size, "device": device, "compute_type": compute_type,
+                  "cpu_threads": cpu_threads, "beam_size": beam_size}
+        try:
+            runs.append(run_isolated(config, args))
+        except Exception as e:
+            runs.append({"model": model_size, "device": device, "compute_type": compute_type,
+                         "cpu_threads": cpu_threads, "beam_size": beam_size, "error": str(e)})
+
+    print_header("RESULTS")
+    print_table(runs)
+
+    if args.json_path:
+        report = {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "platform": platform.platform(),
+            "python": sys.version.split()[0],
+            "cpu_count": os.cpu_count(),
+            "audio": source_name,
+            "repeats": args.repeats,
+            "runs": runs,
+        }
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,35 +2,103 @@ import sys
 import traceback
 import os
 import faulthandler
+import threading
 
-# Enable fault handler to dump traceback on native crash (Segfault)
-faulthandler.enable()
+# Everything with side effects runs from main(): the inference worker is a
+# spawned process that re-imports this module, and must not pull in Qt or CT2.
+profile = None
 
-# Fix common MKL conflict crash on Windows
-os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 
-# CRITICAL: Import CTranslate2/Faster-Whisper BEFORE PyQt6
-# This prevents DLL conflicts (Access Violation) caused by Qt loading incompatible libraries first.
-try:
-    import ctranslate2
-    from faster_whisper import WhisperModel
-    print("Pre-loaded CTranslate2/Faster-Whisper successfully.")
-except ImportError:
-    pass
+def phase(label):
+    from contextlib import nullcontext
+    return profile.phase(label) if profile else nullcontext()
+
+
+def preload_native():
+    # CRITICAL (Windows): Import CTranslate2/Faster-Whisper BEFORE PyQt6
+    # This prevents DLL conflicts (Access Violation) caused by Qt loading incompatible libraries first.
+    with phase("ctranslate2 preload"):
+        try:
+            import ctranslate2
+            from faster_whisper import WhisperModel
+            print("Pre-loaded CTranslate2/Faster-Whisper successfully.")
+        except ImportError:
+            pass
+
+
+def warm_background():
+    # Things the first recording needs, done after the window is up
+    from src.utils.config import Config
+    from src.services.portaudio import get_pyaudio
+    from src.services.openai_client import preload as preload_openai
+
+    try:
+        get_pyaudio()
+        if Config.get_transcriber_backend() != "local":
+            preload_openai()
+    except Exception as e:
+        print(f"Background initialisation failed: {e}")
+
+
+def on_first_paint():
+    threading.Thread(target=warm_background, daemon=True).start()
+    if profile:
+        profile.mark("first paint")
+        profile.stop_tracking()
+        profile.report()
 
-from PyQt6.QtWidgets import QApplication
 
 def main():
+    global profile
+
+    # Enable fault handler to dump traceback on native crash (Segfault)
+    faulthandler.enable()
+
+    # Fix common MKL conflict crash on Windows
+    os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
+
+    # --startup-profile prints where the time goes between launch and first paint
+    if "--startup-profile" in sys.argv:
+        sys.argv.remove("--startup-profile")
+        from src.utils.startup_profile import StartupProfile
+        profile = StartupProfile()
+        profile.track_imports()
+
+    with phase("config"):
+        from src.utils.config import Config
+
+    # Only local decoding in this process needs the DLLs before Qt; the API
+    # backend and the worker process setup skip the cost. Without them, local
+    # decoding here is unsafe once Qt is loaded, so it goes to the worker.
+    in_process_safe = os.name != "nt"
+    if not in_process_safe and Config.get_transcriber_backend() == "local" and not Config.get_inference_process():
+        preload_native()
+        in_process_safe = True
+
+    with phase("import PyQt6"):
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import QTimer
+
     try:
-        from src.ui.main_window import MainWindow
-        
-        app = QApplication(sys.argv)
-        
+        with phase("import main window"):
+            from src.ui.main_window import MainWindow
+        from src.services.transcriber import Transcriber
+        # Switching to local later in Settings then decodes in the worker process
+        Transcriber.in_process_safe = in_process_safe
+
+        with phase("QApplication"):
+            app = QApplication(sys.argv)
+
         # Optional: Set global font or style tweaks here if needed
-        
-        window = MainWindow()
-        window.show()
-        
+
+        with phase("MainWindow()"):
+            window = MainWindow()
+        with phase("show"):
+            window.show()
+
+        # Runs once the event loop has painted the window
+        QTimer.singleShot(0, on_first_paint)
+
         sys.exit(app.exec())
     except Exception:
         print("CRITICAL ERROR CAUGHT IN MAIN:")
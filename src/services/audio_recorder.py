@@ -1,65 +1,195 @@
 import pyaudio
-import wave
+import soundfile as sf
 import threading
 import os
 import tempfile
+import numpy as np
+from collections import deque
+
+from src.services.capture_format import CaptureFormat
+from src.services.portaudio import get_pyaudio
+from src.utils.audio import WHISPER_SAMPLE_RATE
+from src.utils.config import Config
+from src.utils import tracing
 
 class AudioRecorder:
     def __init__(self):
         self.is_recording = False
-        self.frames = []
+        self.frames = [] # List of 16 kHz mono float32 chunks
         self.thread = None
-        self.p = pyaudio.PyAudio()
-        self.temp_filename = os.path.join(tempfile.gettempdir(), "whisper_temp.wav")
+        self.rate = 44100
+        self.channels = 1
+        self.format = pyaudio.paInt16
+        # Optional callable receiving each normalised chunk as it is captured (streaming dictation)
+        self.chunk_callback = None
+        self.temp_filename = None  # Last WAV written by stop_recording(to_file=True)
+
+        # Standby: the stream stays open and the last few hundred ms go into a
+        # pre-roll ring, so a recording starts instantly and includes that audio
+        self._lock = threading.Condition()
+        self._standby = False
+        self._standby_thread = None
+        self._standby_ready = False
+        self._standby_owns = False  # the current recording is fed by the standby stream
+        self._stop_requested = False
+        self._preroll = deque()
+        self._preroll_len = 0
+
+    @property
+    def p(self):
+        # Shared PortAudio session, initialised on first use (or preloaded after startup)
+        return get_pyaudio()
+
+    def start_standby(self):
+        # Non-blocking; the stream is opened on the standby thread
+        if self._standby_thread and self._standby_thread.is_alive():
+            self._standby = True
+            return
+        self._standby = True
+        self._standby_thread = threading.Thread(target=self._standby_loop, daemon=True)
+        self._standby_thread.start()
+
+    def stop_standby(self):
+        # An ongoing recording keeps the stream until it is stopped
+        self._standby = False
 
     def start_recording(self):
         if self.is_recording:
             return
         
-        self.is_recording = True
-        self.frames = []
+        with self._lock:
+            if self._standby_ready:
+                # Stream is already running: just start keeping what it captures
+                self.frames = list(self._preroll)
+                self._preroll.clear()
+                self._preroll_len = 0
+                self.is_recording = True
+                self._standby_owns = True
+                if self.chunk_callback:
+                    for data in self.frames:
+                        self.chunk_callback(data)
+                print("Recording started (standby)...")
+                return
+
+            # Standby came up too late for this one: it must leave the on-demand recording alone
+            self.is_recording = True
+            self._standby_owns = False
+            self.frames = []
         self.thread = threading.Thread(target=self._record)
         self.thread.start()
         print("Recording started...")
 
+    def _standby_loop(self):
+        chunk = 1024
+        capture = CaptureFormat(self.rate, self.channels)
+
+        try:
+            stream = self.p.open(format=self.format,
+                                 channels=self.channels,
+                                 rate=self.rate,
+                                 input=True,
+                                 frames_per_buffer=chunk)
+        except Exception as e:
+            print(f"Standby capture unavailable, recording will open the mic on demand: {e}")
+            self._standby = False
+            return
+
+        print("Standby capture running.")
+        with self._lock:
+            self._standby_ready = True
+        try:
+            while self._standby or self._standby_owns:
+                data = capture.process(stream.read(chunk, exception_on_overflow=False))
+                with self._lock:
+                    if self._standby_owns:
+                        self.frames.append(data)
+                        if self.chunk_callback:
+                            self.chunk_callback(data)
+                        if self._stop_requested:
+                            # The chunk in flight when stop was pressed still belongs to the recording
+                            self.is_recording = False
+                            self._standby_owns = False
+                            self._stop_requested = False
+                            self._lock.notify_all()
+                    elif not self.is_recording:
+                        preroll_max = Config.get_preroll_ms() * WHISPER_SAMPLE_RATE // 1000
+                        self._preroll.append(data)
+                        self._preroll_len += len(data)
+                        while self._preroll and self._preroll_len - len(self._preroll[0]) >= preroll_max:
+                            self._preroll_len -= len(self._preroll.popleft())
+        except Exception as e:
+            print(f"Standby capture stopped: {e}")
+        finally:
+            with self._lock:
+                self._standby_ready = False
+                self._standby = False
+                if self._standby_owns:
+                    self.is_recording = False
+                    self._standby_owns = False
+                self._preroll.clear()
+                self._preroll_len = 0
+                self._lock.notify_all()
+            stream.stop_stream()
+            stream.close()
+
     def _record(self):
         chunk = 1024
-        format = pyaudio.paInt16
-        channels = 1
-        rate = 44100
+        capture = CaptureFormat(self.rate, self.channels)
 
-        stream = self.p.open(format=format,
-                             channels=channels,
-                             rate=rate,
+        stream = self.p.open(format=self.format,
+                             channels=self.channels,
+                             rate=self.rate,
                              input=True,
                              frames_per_buffer=chunk)
 
         while self.is_recording:
-            data = stream.read(chunk)
+            data = capture.process(stream.read(chunk))
             self.frames.append(data)
+            if self.chunk_callback:
+                self.chunk_callback(data)
 
         stream.stop_stream()
         stream.close()
         # Note: We don't terminate self.p here to allow restart
 
-        self._save_to_file(channels, self.p.get_sample_size(format), rate)
-
-    def stop_recording(self):
+    def stop_recording(self, to_file=True):
+        # to_file=False skips the WAV round trip and returns a 16 kHz float32 array instead
         if not self.is_recording:
             return
         
-        self.is_recording = False
-        if self.thread:
-            self.thread.join()
+        with self._lock:
+            standby = self._standby_owns
+        if standby:
+            with tracing.span("capture_join"), self._lock:
+                self._stop_requested = True
+                if not self._lock.wait_for(lambda: not self.is_recording, timeout=0.5):
+                    self.is_recording = False
+                    self._standby_owns = False
+                    self._stop_requested = False
+        else:
+            self.is_recording = False
+            if self.thread:
+                with tracing.span("capture_join"):
+                    self.thread.join()
+                self.thread = None
+
+        if not to_file:
+            print("Recording stopped.")
+            with tracing.span("assemble_audio"):
+                return self.get_audio()
+
+        with tracing.span("wav_write"):
+            self._save_to_file()
         print(f"Recording stopped. Saved to {self.temp_filename}")
         return self.temp_filename
 
-    def _save_to_file(self, channels, sample_width, rate):
-        with wave.open(self.temp_filename, 'wb') as wf:
-            wf.setnchannels(channels)
-            wf.setsampwidth(sample_width)
-            wf.setframerate(rate)
-            wf.writeframes(b''.join(self.frames))
+    def get_audio(self):
+        if not self.frames:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(self.frames)
 
-    def __del__(self):
-        self.p.terminate()
+    def _save_to_file(self):
+        # A new file per recording, so a queued job never reads the next recording
+        fd, self.temp_filename = tempfile.mkstemp(prefix="whisper_", suffix=".wav")
+        os.close(fd)
+        sf.write(self.temp_filename, self.get_audio(), WHISPER_SAMPLE_RATE, subtype='PCM_16')
@@ -0,0 +1,71 @@
+import queue
+import threading
+import time
+import soundfile as sf
+
+from src.utils.audio import WHISPER_SAMPLE_RATE
+
+# libsndfile command id from sndfile.h, not exported by soundfile
+_SFC_UPDATE_HEADER_NOW = 0x1060
+
+
+class AudioFileWriter:
+    """
+    Streams captured blocks to a 16-bit WAV file from a background thread.
+
+    The header is rewritten every `header_interval` seconds, so the file on
+    disk is always a valid WAV holding everything captured up to then, even if
+    the app dies mid-recording. close() only has to drain the last few blocks.
+    """
+
+    def __init__(self, path, rate=WHISPER_SAMPLE_RATE, header_interval=2.0):
+        self.path = path
+        self.rate = rate
+        self.header_interval = header_interval
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        # Open here so errors (bad path, locked file) surface to the caller
+        self._file = sf.SoundFile(self.path, 'w', samplerate=self.rate, channels=1, subtype='PCM_16')
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def write(self, block):
+        self._queue.put(block)
+
+    def close(self):
+        if self._thread:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        last_update = time.monotonic()
+        failed = False
+        while True:
+            block = self._queue.get()
+            if block is None:
+                break
+            if failed:
+                # Keep draining so the capture side never backs up
+                continue
+
+            try:
+                self._file.write(block)
+                if time.monotonic() - last_update >= self.header_interval:
+                    self._update_header()
+                    last_update = time.monotonic()
+            except Exception as e:
+                print(f"Audio file write error ({self.path}): {e}")
+                failed = True
+
+        try:
+            self._file.close()
+        except Exception as e:
+            print(f"Audio file close error ({self.path}): {e}")
+
+    def _update_header(self):
+        sf._snd.sf_command(self._file._file, _SFC_UPDATE_HEADER_NOW, sf._ffi.NULL, 0)
+        self._file.flush()
@@ -0,0 +1,222 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from src.utils.config import Config
+from src.utils.audio import WHISPER_SAMPLE_RATE
+from src.services.model_cache import estimate_model_mb
+
+# Compute types worth trying, fastest first when they are supported
+_CANDIDATE_TYPES = {
+    "cpu": ["int8", "int8_float32", "float32"],
+    "cuda": ["int8_float16", "float16", "int8", "float32"],
+}
+
+# What the quick probe picks when it is viable; float16 avoids the int8 issues of some new GPUs
+_QUICK_TYPES = {"cpu": "int8", "cuda": "float16"}
+
+# A loaded model needs noticeably more than its weights (activations, decoder state)
+_MEMORY_HEADROOM = 1.5
+
+
+def available_memory_mb():
+    # Free physical memory, None if it can't be determined
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/meminfo") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) / 1024
+        elif os.name == "nt":
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                            ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                            ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                            ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                            ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(status)
+            ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status))
+            return status.ullAvailPhys / (1024 * 1024)
+        else:
+            # macOS has no cheap "available" figure, total memory is the best we have
+            return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+
+def probe_hardware():
+    import ctranslate2
+
+    cuda_count = ctranslate2.get_cuda_device_count()
+    device = "cuda" if cuda_count > 0 else "cpu"
+    # CTranslate2 reports what the CPU's instruction set (or the GPU) can run
+    supported = ctranslate2.get_supported_compute_types(device)
+    return {
+        "device": device,
+        "cpu_count": os.cpu_count() or 1,
+        "compute_types": [t for t in _CANDIDATE_TYPES[device] if t in supported],
+        "available_mb": available_memory_mb(),
+    }
+
+
+def thread_candidates(cpu_count):
+    # All logical cores, one per physical core with SMT, and a quarter for busy machines
+    return sorted({n for n in (cpu_count, cpu_count // 2, cpu_count // 4) if n >= 1}, reverse=True)
+
+
+def _fixture(seconds):
+    # Voiced-like harmonics with a syllable-rate envelope; the encoder cost does
+    # not depend on content, the decoder gets something to chew on
+    t = np.arange(int(seconds * WHISPER_SAMPLE_RATE)) / WHISPER_SAMPLE_RATE
+    f0 = 140 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / WHISPER_SAMPLE_RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
+    return (0.1 * voice * envelope).astype(np.float32)
+
+
+def _time_decode(model, audio, repeats, parallel=1):
+    # Wall time of `parallel` decodes at once, the way conference runs both tracks on the shared model
+    def decode(_):
+        segments, _ = model.transcribe(audio, beam_size=1, language="en")
+        list(segments)
+
+    with ThreadPoolExecutor(max_workers=parallel) as pool:
+        list(pool.map(decode, range(parallel)))  # untimed warm-up
+
+        timings = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            list(pool.map(decode, range(parallel)))
+            timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+
+def _viable_types(model_size, hw):
+    compute_types = hw["compute_types"]
+    if hw["available_mb"] is None:
+        return compute_types
+    fits = [t for t in compute_types
+            if estimate_model_mb(model_size, t) * _MEMORY_HEADROOM <= hw["available_mb"]]
+    if not fits:
+        print(f"Warning: {model_size} may not fit in {hw['available_mb']:.0f} MB free memory", flush=True)
+    # Keep the smallest type as a last resort rather than giving up
+    return fits or compute_types[:1]
+
+
+def quick_probe(model_size=None):
+    """
+    Picks settings from the hardware probe alone, without loading a model:
+    the default compute type if it is supported and fits in memory, and one
+    thread per physical core. Takes well under a second, so it runs on first
+    start; calibrate() does the timed sweep when asked. Returns the settings.
+    """
+    model_size = model_size or Config.get_local_model_size()
+    result = _measure(model_size, quick=True)
+    _save(result)
+    print(f"Quick probe picked {_describe(result)}", flush=True)
+    return result
+
+
+def calibrate(model_size=None, seconds=5.0, repeats=2, progress=None):
+    """
+    Times short decodes over the viable compute types and thread counts and
+    stores the fastest combination in Config. Returns the chosen settings.
+    progress(text) is called before each candidate.
+    """
+    model_size = model_size or Config.get_local_model_size()
+    result = _measure(model_size, quick=False, seconds=seconds, repeats=repeats, progress=progress)
+    _save(result)
+    print(f"Calibration picked {_describe(result)}", flush=True)
+    return result
+
+
+def _measure(model_size, quick, seconds=5.0, repeats=2, progress=None):
+    # With the inference process on, CTranslate2 only ever runs in the worker
+    from src.services.transcriber import Transcriber
+    if Transcriber.uses_worker():
+        from src.services.inference_server import get_inference_client
+        return get_inference_client().calibrate(model_size, quick=quick, progress=progress)
+    if quick:
+        return pick_quick(model_size)
+    return sweep(model_size, seconds, repeats, progress)
+
+
+def pick_quick(model_size):
+    hw = probe_hardware()
+    device = hw["device"]
+    compute_types = _viable_types(model_size, hw)
+    if not compute_types:
+        raise RuntimeError("No supported compute type on this machine")
+
+    from src.services.transcriber import SHARED_NUM_WORKERS
+
+    compute_type = _QUICK_TYPES[device] if _QUICK_TYPES[device] in compute_types else compute_types[0]
+    # With SMT half the logical cores is usually as fast and leaves the rest of the machine
+    # responsive; split between the shared model's workers so both tracks together stay within it
+    cpu_threads = max(1, hw["cpu_count"] // 2 // SHARED_NUM_WORKERS) if device == "cpu" else 0
+    return {"device": device, "compute_type": compute_type, "cpu_threads": cpu_threads}
+
+
+def sweep(model_size, seconds=5.0, repeats=2, progress=None):
+    # The timed part of calibrate(); returns the fastest settings without saving them.
+    # cpu_threads is per worker of the shared model, timed with every worker busy.
+    from src.services.transcriber import Transcriber, SHARED_NUM_WORKERS
+
+    hw = probe_hardware()
+    device = hw["device"]
+    print(f"Calibrating {model_size} on {device}: {hw}", flush=True)
+
+    compute_types = _viable_types(model_size, hw)
+    threads = thread_candidates(max(1, hw["cpu_count"] // SHARED_NUM_WORKERS)) if device == "cpu" else [0]
+    audio = _fixture(seconds)
+
+    best = None
+    for compute_type in compute_types:
+        for cpu_threads in threads:
+            label = f"{compute_type}, {cpu_threads or 'auto'} threads per worker"
+            if progress:
+                progress(f"Calibrating: {label}...")
+            try:
+                model = Transcriber._load_model((model_size, device, compute_type, cpu_threads, SHARED_NUM_WORKERS))
+                loaded = Transcriber.loaded_compute_type(model)
+                if not Transcriber.compute_type_matches(compute_type, loaded):
+                    # _load_model fell back to another type; timing it would mislabel the result
+                    raise RuntimeError(f"loaded as {loaded}")
+                elapsed = _time_decode(model, audio, repeats, parallel=SHARED_NUM_WORKERS)
+                del model
+            except Exception as e:
+                print(f"Calibration candidate {label} failed: {e}", flush=True)
+                continue
+
+            print(f"Calibration {label}: {elapsed:.2f} s", flush=True)
+            if best is None or elapsed < best[0]:
+                best = (elapsed, compute_type, cpu_threads)
+
+    if best is None:
+        raise RuntimeError("No compute type could be loaded on this machine")
+
+    _, compute_type, cpu_threads = best
+    return {"device": device, "compute_type": compute_type, "cpu_threads": cpu_threads}
+
+
+def _save(result):
+    from src.services.transcriber import Transcriber
+
+    # A running inference worker gets these through the settings listener
+    with Config.batch():
+        Config.set_tuned_device(result["device"])
+        Config.set_tuned_compute_type(result["compute_type"])
+        Config.set_tuned_cpu_threads(result["cpu_threads"])
+    Transcriber.reset_device()
+
+
+def _describe(result):
+    return f"{result['device']}/{result['compute_type']}, {result['cpu_threads'] or 'auto'} threads per worker"
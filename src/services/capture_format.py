@@ -0,0 +1,28 @@
+import numpy as np
+
+from src.utils.audio import WHISPER_SAMPLE_RATE, StreamResampler, pcm16_to_float32, to_mono
+
+
+class CaptureFormat:
+    """
+    Normalises captured chunks as they arrive: downmix to mono and resample
+    to 16 kHz float32, which is what Whisper consumes. Recorders keep only the
+    normalised chunks, so nothing has to be converted after recording stops.
+    """
+
+    def __init__(self, src_rate, channels=1):
+        self.src_rate = src_rate
+        self.channels = channels
+        self.rate = WHISPER_SAMPLE_RATE
+        self.resampler = StreamResampler(src_rate, self.rate)
+
+    def process(self, data):
+        # data is raw int16 bytes (pyaudio) or a (frames, channels) float array (soundcard)
+        if isinstance(data, (bytes, bytearray)):
+            audio = pcm16_to_float32(data)
+            if self.channels > 1:
+                audio = audio.reshape(-1, self.channels)
+        else:
+            audio = np.asarray(data, dtype=np.float32)
+
+        return self.resampler.process(to_mono(audio))
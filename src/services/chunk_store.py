@@ -0,0 +1,118 @@
+import os
+import tempfile
+import threading
+import weakref
+import numpy as np
+
+from src.utils.config import Config
+from src.utils.audio import WHISPER_SAMPLE_RATE
+
+
+def _remove_quietly(path):
+    # On Windows the file cannot be removed while a memmap of it is alive;
+    # whichever finalizer runs last succeeds.
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class ChunkStore:
+    """
+    Append-only store for captured 16 kHz mono float32 audio.
+
+    Chunks are copied into preallocated fixed-size blocks. At most
+    `ram_seconds` of audio is kept in RAM; older full blocks are appended to a
+    temp file. view() returns the whole session without holding it twice: a
+    concatenation for short sessions, a read-only memmap of the spill file
+    once anything has been spilled.
+    """
+
+    def __init__(self, ram_seconds=None, block_seconds=10, rate=WHISPER_SAMPLE_RATE):
+        if ram_seconds is None:
+            ram_seconds = Config.get_capture_ram_minutes() * 60
+        self.rate = rate
+        self.block_len = int(block_seconds * rate)
+        self.max_ram_blocks = max(1, int(ram_seconds // block_seconds))
+
+        self._lock = threading.Lock()
+        self._blocks = []  # full in-RAM blocks, oldest first
+        self._current = np.empty(self.block_len, dtype=np.float32)
+        self._fill = 0
+
+        self._spill_path = None
+        self._spill_file = None
+        self._spilled = 0  # samples on disk
+
+    def __len__(self):
+        return self._spilled + len(self._blocks) * self.block_len + self._fill
+
+    def append(self, chunk):
+        chunk = np.asarray(chunk, dtype=np.float32)
+        with self._lock:
+            pos = 0
+            while pos < len(chunk):
+                n = min(self.block_len - self._fill, len(chunk) - pos)
+                self._current[self._fill:self._fill + n] = chunk[pos:pos + n]
+                self._fill += n
+                pos += n
+
+                if self._fill == self.block_len:
+                    self._blocks.append(self._current)
+                    self._current = np.empty(self.block_len, dtype=np.float32)
+                    self._fill = 0
+                    while len(self._blocks) > self.max_ram_blocks:
+                        self._spill(self._blocks.pop(0))
+
+    def iter_blocks(self):
+        # Yields the session in order without materialising it
+        with self._lock:
+            spilled = self._spilled
+            blocks = list(self._blocks)
+            current = self._current[:self._fill]
+
+        if spilled:
+            self._spill_file.flush()
+            disk = np.memmap(self._spill_path, dtype=np.float32, mode='r', shape=(spilled,))
+            for start in range(0, spilled, self.block_len):
+                yield disk[start:start + self.block_len]
+        for block in blocks:
+            yield block
+        if len(current):
+            yield current
+
+    def view(self):
+        with self._lock:
+            if not self._spilled:
+                parts = self._blocks + [self._current[:self._fill]]
+                return np.concatenate(parts) if len(parts) > 1 else parts[0].copy()
+
+            # Move everything to disk so the whole session is one contiguous memmap
+            for block in self._blocks:
+                self._spill(block)
+            self._blocks = []
+            if self._fill:
+                self._spill(self._current[:self._fill])
+                self._fill = 0
+            self._spill_file.flush()
+
+            mm = np.memmap(self._spill_path, dtype=np.float32, mode='r', shape=(self._spilled,))
+            weakref.finalize(mm, _remove_quietly, self._spill_path)
+            return mm
+
+    def close(self):
+        with self._lock:
+            self._blocks = []
+            self._fill = 0
+            if self._spill_file:
+                self._spill_file.close()
+                self._spill_file = None
+                _remove_quietly(self._spill_path)
+
+    def _spill(self, block):
+        if self._spill_file is None:
+            fd, self._spill_path = tempfile.mkstemp(prefix="capture_", suffix=".f32")
+            self._spill_file = os.fdopen(fd, "wb")
+            weakref.finalize(self, _remove_quietly, self._spill_path)
+        self._spill_file.write(block.tobytes())
+        self._spilled += len(block)
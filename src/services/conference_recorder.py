@@ -1,124 +1,85 @@
-import threading
-import soundfile as sf
-import pyaudio
-import wave
 import os
 import tempfile
-import numpy as np
+
+from src.services.audio_writer import AudioFileWriter
+from src.services.chunk_store import ChunkStore
+from src.services.duplex_capture import DuplexCapture
 
 class ConferenceRecorder:
     def __init__(self):
         self.is_recording = False
-        self.mic_frames = []
-        self.sys_data = []
+        self.mic_frames = ChunkStore()
+        self.sys_data = ChunkStore()
         
-        self.mic_thread = None
-        self.sys_thread = None
+        self.mic_rate = 44100
+        self.sys_rate = 44100
         
+        # One capture thread drives both devices on a shared clock
+        self.engine = None
+        self.mic_writer = None
+        self.sys_writer = None
+        # Optional callable receiving ('mic' or 'sys', normalised chunk) as it is captured (live conference)
+        self.chunk_callback = None
+
         self.mic_filename = os.path.join(tempfile.gettempdir(), "conf_mic.wav")
         self.sys_filename = os.path.join(tempfile.gettempdir(), "conf_sys.wav")
-        
-        self.p = pyaudio.PyAudio()
 
     def start_recording(self):
         if self.is_recording:
             return
         
         self.is_recording = True
-        self.mic_frames = []
-        self.sys_data = [] # List of numpy arrays
-        
-        self.mic_thread = threading.Thread(target=self._record_mic)
-        self.sys_thread = threading.Thread(target=self._record_system)
+        # 16 kHz mono float32, bounded in RAM
+        self.mic_frames = ChunkStore()
+        self.sys_data = ChunkStore()
+        # Both tracks are streamed to disk while recording (crash safe)
+        self.mic_writer = self._open_writer(self.mic_filename)
+        self.sys_writer = self._open_writer(self.sys_filename)
         
-        self.mic_thread.start()
-        self.sys_thread.start()
+        self.engine = DuplexCapture(self._on_block, self.mic_rate, self.sys_rate)
+        self.engine.start()
         print("Conference Recording started...")
 
-    def stop_recording(self):
+    def stop_recording(self, to_file=True):
+        # to_file=False skips the WAV round trip and returns 16 kHz float32 arrays instead
         if not self.is_recording:
             return None, None
         
         self.is_recording = False
-        if self.mic_thread:
-            self.mic_thread.join()
-        if self.sys_thread:
-            self.sys_thread.join()
+        if self.engine:
+            self.engine.stop()
+            self.engine = None
+            
+        # The files were written while recording, only the last blocks are left
+        for writer in (self.mic_writer, self.sys_writer):
+            if writer:
+                writer.close()
+        self.mic_writer = None
+        self.sys_writer = None
             
         print("Conference Recording stopped.")
+        if not to_file:
+            return self.get_mic_audio(), self.get_sys_audio()
         return self.mic_filename, self.sys_filename
 
-    def _record_mic(self):
-        chunk = 1024
-        format = pyaudio.paInt16
-        channels = 1
-        rate = 44100
-
-        try:
-            stream = self.p.open(format=format,
-                                 channels=channels,
-                                 rate=rate,
-                                 input=True,
-                                 frames_per_buffer=chunk)
-
-            while self.is_recording:
-                data = stream.read(chunk)
-                self.mic_frames.append(data)
+    def get_mic_audio(self):
+        return self.mic_frames.view()
 
-            stream.stop_stream()
-            stream.close()
+    def get_sys_audio(self):
+        return self.sys_data.view()
 
-            with wave.open(self.mic_filename, 'wb') as wf:
-                wf.setnchannels(channels)
-                wf.setsampwidth(self.p.get_sample_size(format))
-                wf.setframerate(rate)
-                wf.writeframes(b''.join(self.mic_frames))
-        except Exception as e:
-            print(f"Mic recording error: {e}")
-
-    def _record_system(self):
-        # Using soundcard for loopback
-        # Default loopback mic
+    def _open_writer(self, path):
         try:
-            import soundcard as sc
-            # Get default speaker
-            speaker = sc.default_speaker()
-            # Get loopback microphone for that speaker
-            # Note: sc.get_microphone(id=str(speaker.name), include_loopback=True) might be needed
-            # But commonly sc.all_microphones(include_loopback=True) finds it.
-            # However, simpler is just record from loopback mic directly if identifiable.
-            # sc.default_microphone() is usually the physical mic.
-            
-            # Find the loopback matching default speaker
-            mics = sc.all_microphones(include_loopback=True)
-            loopback = None
-            # Heuristic: often named after valid output device
-            # For simplicity, let's grab the first loopback device we find
-            for mic in mics:
-                 if mic.isloopback:
-                     loopback = mic
-                     break
-            
-            if not loopback:
-                # Fallback: try to just record from default mic (better than crash)
-                # But user wants system audio.
-                # On Windows, WASAPI loopback is reliable via soundcard.
-                print("No loopback device found. System audio might be silent.")
-                return
-
-            sample_rate = 44100
-            with loopback.recorder(samplerate=sample_rate) as recorder:
-                while self.is_recording:
-                    # Record small chunks
-                    data = recorder.record(numframes=1024)
-                    self.sys_data.append(data)
-            
-            # Save using soundfile
-            full_data = np.concatenate(self.sys_data)
-            sf.write(self.sys_filename, full_data, sample_rate)
-            
+            return AudioFileWriter(path).start()
         except Exception as e:
-            print(f"System recording error: {e}")
+            print(f"Could not open {path} for writing: {e}")
+            return None
 
-    def __del__(self):
-        self.p.terminate()
+    def _on_block(self, name, block, start_time):
+        # Called on the capture thread; blocks of both tracks share one timeline
+        store, writer = (self.mic_frames, self.mic_writer) if name == "mic" else (self.sys_data, self.sys_writer)
+        store.append(block)
+        if writer:
+            writer.write(block)
+        if self.chunk_callback:
+            self.chunk_callback(name, block)
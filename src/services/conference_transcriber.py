@@ -1,31 +1,71 @@
-from src.services.transcriber import Transcriber
+from src.services.echo_filter import EchoFilter, remove_echo_segments
+from src.services.transcriber import Transcriber, SHARED_NUM_WORKERS
+from src.utils.config import Config
+from src.utils import tracing
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import os
 
 class ConferenceTranscriber:
     def __init__(self):
-        self.transcriber = Transcriber()
+        self.transcriber = Transcriber(profile=Config.get_conference_profile(), **self.model_settings())
+
+    @staticmethod
+    def model_settings():
+        # Both tracks are decoded at once on the model dictation uses (same
+        # workers and threads, so the same cache entry). Only a separate
+        # conference model size loads a second model.
+        return {
+            "model_size": Config.get_conference_model_size() or None,
+            "num_workers": SHARED_NUM_WORKERS,
+            "cpu_threads": 0,
+        }
 
     def transcribe_session(self, mic_path, sys_path, language=None):
-        segments = []
+        # Tracks are either file paths or in-memory 16 kHz float32 arrays
+        echo_filter = Config.get_echo_filter()
+        mic_offsets = None
+        if echo_filter and isinstance(mic_path, np.ndarray) and self._has_audio(sys_path):
+            # Speaker output leaking into the mic would be transcribed twice; its spans are cut out
+            with tracing.span("echo_filter"):
+                mic_path, mic_offsets, _ = EchoFilter().suppress(mic_path, sys_path)
 
-        # 1. Transcribe Mic
-        if os.path.exists(mic_path) and os.path.getsize(mic_path) > 1000:
-            mic_raw = self.transcriber.transcribe(mic_path, language, return_segments=True)
-            mic_segs = self._normalize(mic_raw, "User")
-            segments.extend(mic_segs)
-            
-        # 2. Transcribe System
-        if os.path.exists(sys_path) and os.path.getsize(sys_path) > 1000:
-            sys_raw = self.transcriber.transcribe(sys_path, language, return_segments=True)
-            # Use 'System' or 'Attendee'
-            sys_segs = self._normalize(sys_raw, "System")
-            segments.extend(sys_segs)
+        tracks = [(mic_path, "User"), (sys_path, "System")]
+        tracks = [(track, label) for track, label in tracks if self._has_audio(track)]
+        if not tracks:
+            return []
+
+        # Transcribe Mic and System concurrently
+        with ThreadPoolExecutor(max_workers=len(tracks)) as pool:
+            futures = [pool.submit(self._transcribe_track, tracing.current(), track, label, language)
+                       for track, label in tracks]
+
+            segments = []
+            for (_, label), future in zip(tracks, futures):
+                result = future.result()
+                if label == "User" and mic_offsets is not None:
+                    result = mic_offsets.map_segments(result)
+                segments.extend(self._normalize(result, label))
             
-        # 3. Sort by start time
+        # Sort by start time
         segments.sort(key=lambda x: x['start'])
         
+        if echo_filter:
+            segments = remove_echo_segments(segments)
         return segments
 
+    def _transcribe_track(self, job, track, label, language):
+        # Pool threads have no current job of their own, carry the caller's over
+        with tracing.activate(job), tracing.span(f"transcribe_{label.lower()}"):
+            return self.transcriber.transcribe(track, language, return_segments=True)
+
+    def _has_audio(self, track):
+        if track is None:
+            return False
+        if isinstance(track, np.ndarray):
+            return len(track) > 1000
+        return os.path.exists(track) and os.path.getsize(track) > 1000
+
     def _normalize(self, raw_segments, label):
         normalized = []
         for s in raw_segments:
@@ -0,0 +1,52 @@
+# Named speed/accuracy trade-offs for local decoding. "decode" holds
+# faster-whisper transcribe() options, "vad" holds VoiceActivityDetector
+# arguments used to trim silence before decoding.
+PROFILES = {
+    # Greedy, no temperature fallback, tight silence trimming
+    "fastest": {
+        "decode": {
+            "beam_size": 1,
+            "best_of": 1,
+            "temperature": 0.0,
+            "condition_on_previous_text": False,
+            "without_timestamps": True,
+        },
+        "vad": {"pad_ms": 200, "merge_gap_ms": 400},
+    },
+    "balanced": {
+        "decode": {
+            "beam_size": 3,
+            "best_of": 3,
+            "temperature": (0.0, 0.4, 0.8),
+            "condition_on_previous_text": False,
+            "without_timestamps": False,
+        },
+        "vad": {"pad_ms": 300, "merge_gap_ms": 600},
+    },
+    # faster-whisper's own defaults with beam search
+    "accurate": {
+        "decode": {
+            "beam_size": 5,
+            "best_of": 5,
+            "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+            "condition_on_previous_text": True,
+            "without_timestamps": False,
+        },
+        "vad": {"pad_ms": 400, "merge_gap_ms": 800},
+    },
+}
+
+DEFAULT_PROFILE = "accurate"
+
+
+def get_profile(name):
+    # Unknown names fall back to the default instead of failing a recording
+    return PROFILES.get(name, PROFILES[DEFAULT_PROFILE])
+
+
+def decode_options(name, return_segments=False):
+    options = dict(get_profile(name)["decode"])
+    if return_segments:
+        # Callers that need segment times can't use the timestamp-free fast path
+        options["without_timestamps"] = False
+    return options
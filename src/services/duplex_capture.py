@@ -0,0 +1,189 @@
+import threading
+import time
+from contextlib import ExitStack
+import numpy as np
+import pyaudio
+
+from src.services.capture_format import CaptureFormat
+from src.services.portaudio import get_pyaudio
+from src.utils.audio import WHISPER_SAMPLE_RATE
+
+
+class ClockAligner:
+    """
+    Keeps one captured track on the shared monotonic clock.
+
+    Each 16 kHz block comes with the time it was read. The first block is
+    padded so that sample n of the track is n / rate seconds after `t0`. After
+    that the track's lag behind the clock is smoothed and any drift from the
+    starting lag is corrected by resampling blocks by a few hundred ppm at
+    most, which is inaudible and converges over `horizon_seconds`. A sudden
+    jump (samples lost to an overflow) is filled with silence right away.
+    """
+
+    def __init__(self, t0, rate=WHISPER_SAMPLE_RATE, horizon_seconds=10.0, max_ppm=1000, smoothing=0.02,
+                 max_gap_seconds=0.25):
+        self.t0 = t0
+        self.rate = rate
+        self.horizon = horizon_seconds * rate
+        self.max_correction = max_ppm / 1e6
+        self.smoothing = smoothing
+        self.max_gap = max_gap_seconds * rate
+
+        self.produced = 0  # samples handed out so far
+        self.baseline = None  # lag at the start (buffering latency), in samples
+        self.lag = None  # smoothed lag behind the clock, in samples
+        self._prev = 0.0  # last input sample, for interpolation across blocks
+        self._pos = 1.0  # next output position, index 0 being _prev
+
+    def process(self, block, t):
+        # Returns (aligned block, clock time of its first sample)
+        out = []
+        lag = (t - self.t0) * self.rate - (self.produced + len(block))
+
+        if self.baseline is None:
+            start = int(lag)
+            if start > 0:
+                out.append(np.zeros(start, dtype=np.float32))
+                lag -= start
+            self.baseline = self.lag = lag
+        elif lag - self.lag > self.max_gap:
+            # The device skipped audio; keep the timeline by filling the hole
+            gap = int(lag - self.lag)
+            out.append(np.zeros(gap, dtype=np.float32))
+            lag -= gap
+        self.lag += self.smoothing * (lag - self.lag)
+
+        # Behind the clock: stretch a little, ahead: compress a little
+        drift = (self.lag - self.baseline) / self.horizon
+        ratio = 1.0 + min(self.max_correction, max(-self.max_correction, drift))
+        out.append(self._resample(block, ratio))
+
+        start_time = self.t0 + self.produced / self.rate
+        aligned = np.concatenate(out) if len(out) > 1 else out[0]
+        self.produced += len(aligned)
+        return aligned, start_time
+
+    def _resample(self, block, ratio):
+        # Linear interpolation with the phase carried over, ratio = output / input length
+        if len(block) == 0:
+            return block
+        buf = np.concatenate(([self._prev], block))
+        last = len(buf) - 1
+        step = 1.0 / ratio
+        if self._pos > last:
+            self._pos -= last
+            self._prev = buf[-1]
+            return np.zeros(0, dtype=np.float32)
+
+        count = int((last - self._pos) / step + 1e-9) + 1
+        positions = self._pos + step * np.arange(count)
+        self._pos = positions[-1] + step - last
+        self._prev = buf[-1]
+        return np.interp(positions, np.arange(len(buf)), buf).astype(np.float32)
+
+
+class DuplexCapture:
+    """
+    Captures the microphone and the system loopback from one scheduler thread.
+
+    The loop waits on the loopback device (soundcard returns whatever WASAPI
+    has, at most a few device periods later) and then drains everything the
+    mic stream has buffered without blocking. Without a loopback device the
+    mic read paces the loop instead. Every block is stamped with
+    time.monotonic() right after the read and put on the shared clock by a
+    ClockAligner, so both tracks stay interleaved over long sessions.
+
+    on_block(name, block, start_time) gets 'mic' or 'sys', aligned 16 kHz
+    float32 audio, and the monotonic time of its first sample.
+    """
+
+    def __init__(self, on_block, mic_rate=44100, sys_rate=44100, mic_chunk=1024):
+        self.on_block = on_block
+        self.mic_rate = mic_rate
+        self.sys_rate = sys_rate
+        self.mic_chunk = mic_chunk
+        self.running = False
+        self.thread = None
+        self.t0 = None
+
+    def start(self):
+        self.running = True
+        self.t0 = time.monotonic()
+        self.thread = threading.Thread(target=self._run, name="duplex-capture", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def _run(self):
+        with ExitStack() as stack:
+            mic = self._open_mic(stack)
+            loopback = self._open_loopback(stack)
+            if mic is None and loopback is None:
+                return
+
+            mic_format = CaptureFormat(self.mic_rate)
+            sys_format = None
+            mic_clock = ClockAligner(self.t0)
+            sys_clock = ClockAligner(self.t0)
+
+            try:
+                while self.running:
+                    if loopback is not None:
+                        data = loopback.record(numframes=None)
+                        stamp = time.monotonic()
+                        if len(data):
+                            if sys_format is None:
+                                sys_format = CaptureFormat(self.sys_rate, data.shape[1] if data.ndim > 1 else 1)
+                            self._deliver("sys", sys_clock, sys_format.process(data), stamp)
+
+                    if mic is not None:
+                        # With a loopback to wait on, only take what is already there
+                        frames = mic.get_read_available() if loopback is not None else self.mic_chunk
+                        if frames:
+                            data = mic.read(frames, exception_on_overflow=False)
+                            self._deliver("mic", mic_clock, mic_format.process(data), time.monotonic())
+            except Exception as e:
+                print(f"Duplex capture error: {e}")
+
+    def _deliver(self, name, clock, block, stamp):
+        if len(block) == 0:
+            return
+        aligned, start_time = clock.process(block, stamp)
+        self.on_block(name, aligned, start_time)
+
+    def _open_mic(self, stack):
+        try:
+            # A few chunks of headroom: the mic is polled between loopback reads
+            stream = get_pyaudio().open(format=pyaudio.paInt16,
+                                        channels=1,
+                                        rate=self.mic_rate,
+                                        input=True,
+                                        frames_per_buffer=self.mic_chunk * 4)
+        except Exception as e:
+            print(f"Mic recording error: {e}")
+            return None
+
+        def close():
+            stream.stop_stream()
+            stream.close()
+        stack.callback(close)
+        return stream
+
+    def _open_loopback(self, stack):
+        # Using soundcard for loopback (WASAPI on Windows)
+        try:
+            import soundcard as sc
+            # For simplicity, grab the first loopback device we find
+            loopback = next((m for m in sc.all_microphones(include_loopback=True) if m.isloopback), None)
+            if not loopback:
+                print("No loopback device found. System audio might be silent.")
+                return None
+            return stack.enter_context(loopback.recorder(samplerate=self.sys_rate))
+        except Exception as e:
+            print(f"System recording error: {e}")
+            return None
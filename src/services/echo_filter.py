@@ -0,0 +1,192 @@
+import difflib
+import re
+from bisect import bisect_left, bisect_right
+import numpy as np
+
+from src.services.chunk_store import ChunkStore
+from src.services.vad import OffsetMap
+from src.utils.audio import WHISPER_SAMPLE_RATE
+
+
+class EchoFilter:
+    """
+    Finds speaker echo in the mic track using the system track as reference.
+
+    The echo delay is estimated once by cross-correlating the energy envelopes
+    of both tracks. The mic is then cut into short spans and each one is
+    compared with the delayed system audio: a span is echo when its
+    log-spectrum follows the system one closely and the mic is not much louder
+    than the echo gain seen elsewhere in the session (which would mean the
+    user is talking over the remote side). Echo spans are cut out of the mic
+    track before decoding, with an OffsetMap to put the User segments back on
+    the session timeline.
+    """
+
+    def __init__(self, rate=WHISPER_SAMPLE_RATE, frame_len=512, frames_per_span=16, max_lag_ms=500,
+                 min_correlation=0.6, max_gain_ratio=4.0, silence_dbfs=-55.0, block_spans=120):
+        self.rate = rate
+        self.frame_len = frame_len
+        self.span_len = frame_len * frames_per_span  # ~0.5 s at 16 kHz
+        self.max_lag = int(rate * max_lag_ms / 1000)
+        self.min_correlation = min_correlation
+        self.max_gain_ratio = max_gain_ratio
+        self.silence = 10 ** (silence_dbfs / 10)  # mean square
+        self.block_spans = block_spans  # spans analysed per step, bounds memory on long sessions
+
+        self.window = np.hanning(frame_len).astype(np.float32)
+        # Speech band only (100 Hz - 4 kHz), low rumble and hiss don't echo alike
+        freqs = np.fft.rfftfreq(frame_len, 1 / rate)
+        self.band = (freqs >= 100) & (freqs <= 4000)
+
+    def suppress(self, mic, sys):
+        # Returns (mic without its echo spans, OffsetMap back to the mic timeline, seconds removed).
+        # Without echo the mic comes back as is, with an identity map.
+        mask, lag = self.find_echo(mic, sys)
+        if not mask.any():
+            return mic, OffsetMap([], self.rate), 0.0
+
+        kept = self.kept_spans(mask, len(mic))
+        # Copied block by block into a ChunkStore, so a long memmapped session
+        # spills to disk like the capture did instead of landing in RAM whole
+        store = ChunkStore(rate=self.rate)
+        block = self.block_spans * self.span_len
+        for start, end in kept:
+            for pos in range(start, end, block):
+                store.append(mic[pos:min(pos + block, end)])
+        removed = mask.sum() * self.span_len / self.rate
+        print(f"Echo filter: {removed:.1f}s of mic audio is echo (delay {lag * 1000 / self.rate:.0f} ms)")
+        return store.view(), OffsetMap(kept, self.rate), removed
+
+    def kept_spans(self, mask, length):
+        # [start, end) sample ranges of the mic outside echo spans; the partial span at the end is kept
+        edges = np.flatnonzero(np.diff(np.concatenate([[1], mask.astype(np.int8), [1]])))
+        spans = [(s * self.span_len, e * self.span_len) for s, e in zip(edges[0::2], edges[1::2])]
+        if spans and spans[-1][1] == len(mask) * self.span_len:
+            spans[-1] = (spans[-1][0], length)
+        elif len(mask) * self.span_len < length:
+            spans.append((len(mask) * self.span_len, length))
+        return spans
+
+    def find_echo(self, mic, sys):
+        # Returns (bool per span of the mic track, echo delay in samples)
+        n_spans = len(mic) // self.span_len
+        if n_spans == 0 or len(sys) == 0:
+            return np.zeros(n_spans, dtype=bool), 0
+
+        lag = self.estimate_lag(mic, sys)
+        corr = np.empty(n_spans)
+        mic_energy = np.empty(n_spans)
+        sys_energy = np.empty(n_spans)
+        for first in range(0, n_spans, self.block_spans):
+            last = min(n_spans, first + self.block_spans)
+            start, stop = first * self.span_len, last * self.span_len
+            m = np.asarray(mic[start:stop], dtype=np.float32)
+            s = self._slice(sys, start - lag, stop - lag)
+            corr[first:last], mic_energy[first:last], sys_energy[first:last] = self._span_features(m, s)
+
+        active = (mic_energy > self.silence) & (sys_energy > self.silence)
+        similar = active & (corr >= self.min_correlation)
+        if not similar.any():
+            return np.zeros(n_spans, dtype=bool), lag
+
+        # Typical echo path gain; spans well above it have the user talking too
+        gain = np.median(mic_energy[similar] / sys_energy[similar])
+        mask = similar & (mic_energy <= gain * self.max_gain_ratio * sys_energy)
+        return mask, lag
+
+    def estimate_lag(self, mic, sys):
+        # Samples by which the echo in the mic trails the system track (may be negative)
+        hop = self.rate // 100
+        a = self._envelope(mic, hop)
+        b = self._envelope(sys, hop)
+        n = min(len(a), len(b))
+        if n < 2:
+            return 0
+        a, b = a[:n] - a[:n].mean(), b[:n] - b[:n].mean()
+
+        size = 1 << int(np.ceil(np.log2(2 * n)))
+        xcorr = np.fft.irfft(np.fft.rfft(a, size) * np.conj(np.fft.rfft(b, size)), size)
+        max_lag = min(n - 1, self.max_lag // hop)
+        lags = np.arange(-max_lag, max_lag + 1)
+        return int(lags[np.argmax(xcorr[lags])]) * hop
+
+    def _span_features(self, mic, sys):
+        # Per span: log-spectrum correlation, mic and system mean square
+        spans = len(mic) // self.span_len
+        m = mic.reshape(spans, -1)
+        s = sys.reshape(spans, -1)
+        mic_energy = np.mean(m * m, axis=1)
+        sys_energy = np.mean(s * s, axis=1)
+
+        m_spec = self._log_spectrum(mic).reshape(spans, -1)
+        s_spec = self._log_spectrum(sys).reshape(spans, -1)
+        m_spec -= m_spec.mean(axis=1, keepdims=True)
+        s_spec -= s_spec.mean(axis=1, keepdims=True)
+        denom = np.sqrt((m_spec * m_spec).sum(axis=1) * (s_spec * s_spec).sum(axis=1)) + 1e-12
+        corr = (m_spec * s_spec).sum(axis=1) / denom
+        return corr, mic_energy, sys_energy
+
+    def _log_spectrum(self, audio):
+        frames = audio.reshape(-1, self.frame_len) * self.window
+        mag = np.abs(np.fft.rfft(frames, axis=1))[:, self.band]
+        return np.log(mag + 1e-6)
+
+    def _envelope(self, audio, hop):
+        # Log frame energy, computed in blocks so memmapped tracks are not loaded whole
+        n = len(audio) // hop
+        env = np.empty(n)
+        block = hop * 6000
+        for start in range(0, n * hop, block):
+            x = np.asarray(audio[start:min(start + block, n * hop)], dtype=np.float32).reshape(-1, hop)
+            env[start // hop:start // hop + len(x)] = np.log(np.mean(x * x, axis=1) + 1e-10)
+        return env
+
+    @staticmethod
+    def _slice(audio, start, stop):
+        # audio[start:stop] with zeros outside the track
+        out = np.zeros(stop - start, dtype=np.float32)
+        lo, hi = max(start, 0), min(stop, len(audio))
+        if lo < hi:
+            out[lo - start:hi - start] = audio[lo:hi]
+        return out
+
+
+def remove_echo_segments(segments, history=(), tolerance=1.5, min_similarity=0.8, min_words=4):
+    """
+    Drops 'User' segments whose text repeats an overlapping 'System' segment.
+
+    Catches the echo the audio pass let through. `segments` and `history`
+    (System segments already written out) are dicts with start/end/text/speaker.
+    User segments shorter than `min_words` are always kept: a short reply
+    ("Okay.") shares its words with too many System lines to tell echo apart.
+    """
+    system = sorted((s for s in list(history) + list(segments) if s['speaker'] == "System"),
+                    key=lambda s: s['start'])
+    starts = [s['start'] for s in system]
+
+    kept = []
+    for seg in segments:
+        if seg['speaker'] == "User" and len(_normalize(seg['text'])) >= min_words:
+            # Whisper segments are at most 30 s long, so only look that far back
+            lo = bisect_left(starts, seg['start'] - tolerance - 30.0)
+            hi = bisect_right(starts, seg['end'] + tolerance)
+            if any(other['end'] + tolerance >= seg['start'] and
+                   _similarity(seg['text'], other['text']) >= min_similarity
+                   for other in system[lo:hi]):
+                continue
+        kept.append(seg)
+    return kept
+
+
+def _similarity(text, reference):
+    # Share of `text` that also appears in `reference` (echo is often a piece of a longer segment)
+    a, b = _normalize(text), _normalize(reference)
+    if not a or not b:
+        return 0.0
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    matched = sum(block.size for block in matcher.get_matching_blocks())
+    return matched / len(a)
+
+
+def _normalize(text):
+    return re.sub(r"[^\w ]+", "", text.lower()).split()
@@ -0,0 +1,202 @@
+import atexit
+import itertools
+import multiprocessing
+import queue
+import threading
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.services import inference_worker
+from src.utils.config import Config
+
+# What the worker sends back per segment; quacks like a faster-whisper Segment
+RemoteSegment = namedtuple("RemoteSegment", ["start", "end", "text"])
+
+# How often waiting threads check that the worker is still alive
+_REPLY_POLL_SECONDS = 0.5
+
+
+class InferenceClient:
+    """
+    Runs local Whisper decoding in a long-lived worker process.
+
+    The worker keeps its models resident across jobs. Requests name a model
+    by (size, cpu_threads, num_workers) only: CUDA detection and the compute
+    type are resolved in the worker, so CTranslate2 is never loaded next to
+    Qt. Audio arrays are handed over in a shared-memory block (file paths are
+    passed as is) and segments are streamed back one by one as they are
+    decoded. Settings saved in this process are forwarded to the worker. If
+    the worker dies, only the jobs in flight fail; the next job starts a
+    fresh worker.
+    """
+
+    def __init__(self):
+        # spawn everywhere: a forked copy of a Qt process is not safe to run
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()  # guards the process, its request queue and _pending
+        self._process = None
+        self._requests = None
+        self._pending = {}  # job id -> (process, queue.Queue)
+        self._ids = itertools.count(1)
+        Config.subscribe(self._forward_settings)
+
+    def is_running(self):
+        with self._lock:
+            return self._process is not None and self._process.is_alive()
+
+    def transcribe(self, spec, audio, language, initial_prompt, options, batch_size=0):
+        return list(self.transcribe_stream(spec, audio, language, initial_prompt, options, batch_size))
+
+    def transcribe_stream(self, spec, audio, language, initial_prompt, options, batch_size=0):
+        # Yields RemoteSegments as the worker produces them
+        request = {"kind": "transcribe", "spec": spec, "language": language, "initial_prompt": initial_prompt,
+                   "options": options, "batch_size": batch_size}
+        shm = None
+        if isinstance(audio, np.ndarray):
+            audio = np.ascontiguousarray(audio, dtype=np.float32)
+            shm = shared_memory.SharedMemory(create=True, size=max(1, audio.nbytes))
+            view = np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)
+            view[:] = audio
+            del view  # the block can't be closed while a view exists
+            request["shm"] = shm.name
+            request["length"] = len(audio)
+        else:
+            request["path"] = audio
+
+        try:
+            for kind, payload in self._call(request):
+                if kind == "segment":
+                    yield RemoteSegment(*payload)
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    def warm_up(self, spec):
+        for _ in self._call({"kind": "warm_up", "spec": spec}):
+            pass
+
+    def prefetch(self, spec, on_done=None):
+        # Returns right away; on_done(ok) runs once the worker has the model loaded
+        threading.Thread(target=self._prefetch, args=(spec, on_done), daemon=True).start()
+
+    def _prefetch(self, spec, on_done):
+        try:
+            for _ in self._call({"kind": "prefetch", "spec": spec}):
+                pass
+            ok = True
+        except Exception as e:
+            print(f"Background model load failed for {spec}: {e}")
+            ok = False
+        if on_done:
+            on_done(ok)
+
+    def calibrate(self, model_size, quick=False, progress=None):
+        # Measures in the worker and returns the chosen settings; saving them is up to the caller
+        result = None
+        for kind, payload in self._call({"kind": "calibrate", "model_size": model_size, "quick": quick}):
+            if kind == "progress" and progress:
+                progress(payload)
+            elif kind == "result":
+                result = payload
+        return result
+
+    def shutdown(self):
+        with self._lock:
+            process, self._process = self._process, None
+            if process is None:
+                return
+            try:
+                self._requests.put(None)
+            except (OSError, ValueError):
+                pass
+        process.join(timeout=2)
+        if process.is_alive():
+            process.terminate()
+
+    def _forward_settings(self, changed):
+        # A running worker took its settings at spawn; keep it in step with what the UI saves
+        with self._lock:
+            if self._process is None or not self._process.is_alive():
+                return
+            self._requests.put({"kind": "settings", "values": Config.values(changed)})
+
+    def _call(self, request):
+        # Sends one request and yields (kind, payload) replies until it is done
+        job_id = next(self._ids)
+        replies = queue.Queue()
+        request["id"] = job_id
+        with self._lock:
+            process = self._ensure_started()
+            self._pending[job_id] = (process, replies)
+            self._requests.put(request)
+        try:
+            while True:
+                try:
+                    kind, payload = replies.get(timeout=_REPLY_POLL_SECONDS)
+                except queue.Empty:
+                    # Decodes can take minutes; only a dead worker ends the wait
+                    if process.is_alive():
+                        continue
+                    raise RuntimeError(f"Inference process died (exit code {process.exitcode})")
+                if kind == "error":
+                    raise RuntimeError(payload)
+                if kind == "done":
+                    return
+                yield kind, payload
+        finally:
+            with self._lock:
+                self._pending.pop(job_id, None)
+
+    def _ensure_started(self):
+        # Caller holds _lock
+        if self._process is not None and self._process.is_alive():
+            return self._process
+        if self._process is not None:
+            print(f"Inference process exited (code {self._process.exitcode}), restarting...", flush=True)
+
+        self._requests = self._ctx.Queue()
+        responses = self._ctx.Queue()
+        self._process = self._ctx.Process(target=inference_worker.serve, args=(self._requests, responses),
+                                          name="whisper-inference", daemon=True)
+        self._process.start()
+        threading.Thread(target=self._read_responses, args=(self._process, responses), daemon=True).start()
+        return self._process
+
+    def _read_responses(self, process, responses):
+        while True:
+            try:
+                job_id, kind, payload = responses.get(timeout=_REPLY_POLL_SECONDS)
+            except queue.Empty:
+                if process.is_alive():
+                    continue
+                break
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                entry = self._pending.get(job_id)
+            if entry:
+                entry[1].put((kind, payload))
+
+        # Worker is gone: fail whatever it was working on. Jobs registered after
+        # this see the dead process themselves while waiting.
+        message = f"Inference process died (exit code {process.exitcode})"
+        with self._lock:
+            orphans = [replies for owner, replies in self._pending.values() if owner is process]
+        for replies in orphans:
+            replies.put(("error", message))
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_inference_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = InferenceClient()
+            atexit.register(_client.shutdown)
+        return _client
@@ -0,0 +1,86 @@
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Worker side of InferenceClient. The spawn start method re-imports the app's
+# main module in the child, which is why main.py keeps its side effects (Qt,
+# the CTranslate2 preload) inside main(). Keep the imports here light too:
+# CTranslate2 and faster-whisper are only loaded by the requests that need them.
+
+
+def serve(requests, responses):
+    import faulthandler
+    from src.services.transcriber import Transcriber
+    from src.utils.config import Config
+
+    # A native crash in the worker still leaves a traceback, as in the app process
+    faulthandler.enable()
+
+    print("Inference process started.", flush=True)
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        if request["kind"] == "settings":
+            # Applied in order, before any request sent after the change
+            Config.update(request["values"])
+            Transcriber.reset_device()
+            continue
+        # One thread per job so a model with num_workers > 1 serves jobs in parallel
+        threading.Thread(target=_handle, args=(Transcriber, request, responses), daemon=True).start()
+
+
+def _handle(Transcriber, request, responses):
+    job_id = request["id"]
+    try:
+        if request["kind"] == "calibrate":
+            _calibrate(request, responses)
+            responses.put((job_id, "done", None))
+            return
+
+        # The parent only says which model; device and compute type are resolved here
+        model = Transcriber._get_model_cache().get(Transcriber.resolve_key(request["spec"]))
+        if request["kind"] == "prefetch":
+            pass  # loaded, that is all
+        elif request["kind"] == "warm_up":
+            Transcriber.warm_up_model(model)
+        else:
+            audio = _read_audio(request)
+            segments = Transcriber.decode_segments(model, audio, request["language"], request["initial_prompt"],
+                                                   request["options"], request["batch_size"])
+            for s in segments:
+                responses.put((job_id, "segment", (s.start, s.end, s.text)))
+        responses.put((job_id, "done", None))
+    except Exception as e:
+        responses.put((job_id, "error", f"{type(e).__name__}: {e}"))
+
+
+def _calibrate(request, responses):
+    # Measures only; the parent saves the result so its settings stay the source of truth
+    from src.services import auto_tuner
+
+    job_id = request["id"]
+    if request["quick"]:
+        result = auto_tuner.pick_quick(request["model_size"])
+    else:
+        result = auto_tuner.sweep(request["model_size"],
+                                  progress=lambda text: responses.put((job_id, "progress", text)))
+    responses.put((job_id, "result", result))
+
+
+def _read_audio(request):
+    if "path" in request:
+        return request["path"]
+
+    shm = shared_memory.SharedMemory(name=request["shm"])
+    try:
+        # The parent owns the block; stop this process's tracker from unlinking it at exit
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    try:
+        return np.ndarray((request["length"],), dtype=np.float32, buffer=shm.buf).copy()
+    finally:
+        shm.close()
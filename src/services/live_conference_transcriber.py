@@ -0,0 +1,128 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.services.conference_transcriber import ConferenceTranscriber
+from src.services.echo_filter import remove_echo_segments
+from src.services.report_generator import ReportGenerator
+from src.services.streaming_transcriber import RollingWindow
+from src.services.transcriber import Transcriber
+from src.utils.config import Config
+from src.utils.audio import WHISPER_SAMPLE_RATE
+
+
+class _Track:
+    # Rolling state of one conference track
+    def __init__(self, label, holdback_seconds, max_window_seconds):
+        self.label = label
+        self.window = RollingWindow(holdback_seconds, max_window_seconds)
+        # The window's offset once its segments are in the report queue, read under _report_lock
+        self.offset = 0.0
+        self.thread = None
+        self.error = None
+
+
+class LiveConferenceTranscriber:
+    """
+    Transcribes both conference tracks while the meeting is running.
+
+    ConferenceRecorder pushes 16 kHz float32 blocks into feed(). Each track
+    has a thread that, like StreamingTranscriber, steps a RollingWindow every
+    `step_seconds`, so settled segments are decoded once. Committed segments are
+    appended to the markdown report once neither track can still produce an
+    earlier one, so the file stays in time order and grows during the call.
+    On finish() only the last window of each track is left to decode.
+    """
+
+    def __init__(self, language=None, output_path=None, step_seconds=5.0, holdback_seconds=3.0,
+                 max_window_seconds=30.0):
+        self.language = language
+        self.step_seconds = step_seconds
+
+        # Same model as the offline conference path; windows are not worth caching
+        self.transcriber = Transcriber(use_cache=False, profile=Config.get_conference_profile(),
+                                       **ConferenceTranscriber.model_settings())
+
+        self.tracks = {name: _Track(label, holdback_seconds, max_window_seconds)
+                       for name, label in (("mic", "User"), ("sys", "System"))}
+        self._stopping = False
+        self._wakeup = threading.Event()
+        self._report_lock = threading.Lock()
+        self._ready = []  # committed segments not yet in the report
+        self._recent_system = []  # System lines already written, to spot echoed User lines
+        self.report_path = ReportGenerator.start_report(output_path)
+
+    def start(self):
+        self._stopping = False
+        for track in self.tracks.values():
+            track.thread = threading.Thread(target=self._run, args=(track,), daemon=True)
+            track.thread.start()
+
+    def feed(self, name, data):
+        # Called from the capture threads with name 'mic' or 'sys'
+        self.tracks[name].window.feed(data)
+
+    def finish(self):
+        self._stopping = True
+        self._wakeup.set()
+        for track in self.tracks.values():
+            if track.thread:
+                track.thread.join()
+
+        # Whatever is left is decoded and committed in full, both tracks at once.
+        # A track whose live decoding failed is caught up here from its tail.
+        tracks = [t for t in self.tracks.values() if t.window.take_pending() or len(t.window.tail) > 0]
+        if tracks:
+            with ThreadPoolExecutor(max_workers=len(tracks)) as pool:
+                finished = pool.map(lambda t: t.window.finish(lambda audio: self._decode(t, audio)), tracks)
+                for track, segments in zip(tracks, finished):
+                    self._queue(track, segments)
+
+        self._flush(final=True)
+        return self.report_path
+
+    def _run(self, track):
+        step_samples = int(self.step_seconds * WHISPER_SAMPLE_RATE)
+
+        while not self._stopping:
+            self._wakeup.wait(timeout=self.step_seconds / 4)
+            if self._stopping:
+                break
+
+            track.window.take_pending()
+            if not track.window.due(step_samples):
+                continue
+
+            try:
+                self._queue(track, track.window.step(lambda audio: self._decode(track, audio)))
+            except Exception as e:
+                # Recording goes on; finish() decodes the rest of this track in one go
+                print(f"Live transcription error ({track.label}): {e}")
+                track.error = e
+                return
+            self._flush()
+
+    def _queue(self, track, segments):
+        # Committed segments go to the report queue together with the offset they settle
+        with self._report_lock:
+            self._ready.extend(dict(s, speaker=track.label) for s in segments)
+            track.offset = track.window.offset
+
+    def _flush(self, final=False):
+        with self._report_lock:
+            # A track can still commit segments starting from its tail offset on
+            offsets = [t.offset for t in self.tracks.values() if t.window.fed]
+            horizon = float("inf") if final else min(offsets, default=0.0)
+
+            self._ready.sort(key=lambda s: s['start'])
+            count = next((i for i, s in enumerate(self._ready) if s['start'] >= horizon), len(self._ready))
+            settled, self._ready = self._ready[:count], self._ready[count:]
+            if Config.get_echo_filter():
+                # Windows don't line up across tracks, so only the text pass applies here
+                settled = remove_echo_segments(settled, history=self._recent_system)
+                self._recent_system.extend(s for s in settled if s['speaker'] == "System")
+                self._recent_system = [s for s in self._recent_system if s['end'] > horizon - 30.0]
+            ReportGenerator.append_segments(self.report_path, settled)
+
+    def _decode(self, track, audio):
+        return self.transcriber.transcribe(audio, self.language, return_segments=True,
+                                           initial_prompt=track.window.prompt())
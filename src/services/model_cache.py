@@ -0,0 +1,150 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+# Rough resident size of the float16 weights per model size, in MB
+_MODEL_MB = {
+    "tiny": 75,
+    "base": 145,
+    "small": 480,
+    "medium": 1530,
+    "large": 3090,
+}
+
+_COMPUTE_TYPE_SCALE = {
+    "int8": 0.5,
+    "int8_float16": 0.5,
+    "int8_float32": 0.5,
+    "float16": 1.0,
+    "float32": 2.0,
+}
+
+
+def estimate_model_mb(model_size, compute_type):
+    base = _MODEL_MB.get(model_size.split(".")[0].split("-")[0], _MODEL_MB["large"])
+    return base * _COMPUTE_TYPE_SCALE.get(compute_type, 1.0)
+
+
+class ModelCache:
+    """
+    LRU cache of loaded models with a memory budget and idle unloading.
+
+    Keys are (model_size, device, compute_type, cpu_threads, num_workers). A
+    missing model is built once by whichever caller asks first; concurrent
+    callers for the same key wait for that build, callers for other keys are
+    not blocked. Eviction only drops the cache's reference, so a request that
+    is still decoding on an evicted model finishes on it.
+    """
+
+    def __init__(self, loader, budget_mb=4096, idle_seconds=0):
+        self.loader = loader
+        self.budget_mb = budget_mb
+        self.idle_seconds = idle_seconds
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> [model, size_mb, last_used]
+        self._building = {}  # key -> Future
+        self._reaper = None
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+                entry[2] = time.monotonic()
+                return entry[0]
+
+            future = self._building.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._building[key] = future
+
+        if owner:
+            try:
+                model = self.loader(key)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                self._insert(key, model)
+                future.set_result(model)
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+
+        return future.result()
+
+    def prefetch(self, key, on_done=None):
+        # Build a model in the background; it is swapped in once fully loaded.
+        # on_done(ok) runs once the model is in the cache (or failed to load).
+        with self._lock:
+            loaded = key in self._entries
+        if loaded:
+            if on_done:
+                on_done(True)
+            return
+        # A build already in flight is joined, not repeated
+        threading.Thread(target=self._prefetch, args=(key, on_done), daemon=True).start()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def configure(self, budget_mb=None, idle_seconds=None):
+        with self._lock:
+            if budget_mb is not None:
+                self.budget_mb = budget_mb
+            if idle_seconds is not None:
+                self.idle_seconds = idle_seconds
+            # Never evict the most recently used model, even if it alone exceeds the budget
+            self._evict_over_budget(keep=next(reversed(self._entries), None))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _prefetch(self, key, on_done):
+        try:
+            self.get(key)
+            ok = True
+        except Exception as e:
+            print(f"Background model load failed for {key}: {e}")
+            ok = False
+        if on_done:
+            on_done(ok)
+
+    def _insert(self, key, model):
+        size_mb = estimate_model_mb(key[0], key[2])
+        with self._lock:
+            self._entries[key] = [model, size_mb, time.monotonic()]
+            self._evict_over_budget(keep=key)
+            self._start_reaper()
+
+    def _evict_over_budget(self, keep):
+        total = sum(e[1] for e in self._entries.values())
+        for key in list(self._entries):
+            if total <= self.budget_mb:
+                break
+            if key == keep:
+                continue
+            print(f"Unloading model {key} (memory budget)")
+            total -= self._entries.pop(key)[1]
+
+    def _start_reaper(self):
+        if self._reaper is None and self.idle_seconds > 0:
+            self._reaper = threading.Thread(target=self._reap, daemon=True)
+            self._reaper.start()
+
+    def _reap(self):
+        while True:
+            interval = self.idle_seconds / 4 if self.idle_seconds > 0 else 30
+            time.sleep(min(30, max(1, interval)))
+            with self._lock:
+                if self.idle_seconds <= 0:
+                    continue
+                now = time.monotonic()
+                for key, entry in list(self._entries.items()):
+                    if now - entry[2] > self.idle_seconds:
+                        print(f"Unloading model {key} (idle)")
+                        del self._entries[key]
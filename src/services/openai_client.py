@@ -0,0 +1,67 @@
+import asyncio
+import importlib
+import threading
+
+from src.utils.config import Config
+
+# The openai/httpx imports are deferred to the first request: they cost a few
+# hundred ms at startup and the local backend never needs them.
+
+_lock = threading.Lock()
+_client = None
+_client_key = None
+_async_client = None
+_async_client_key = None
+
+
+def _settings():
+    api_key = Config.get_openai_api_key()
+    if not api_key:
+        raise ValueError("OpenAI API Key is missing. Please set it in Settings.")
+    return api_key, Config.get_openai_base_url() or None
+
+
+def _pool_options():
+    import httpx
+
+    # One connection pool for the whole process; idle connections are kept open
+    # long enough that back-to-back dictations skip the TCP/TLS handshake.
+    return {
+        "limits": httpx.Limits(max_connections=8, max_keepalive_connections=8, keepalive_expiry=300),
+        "timeout": httpx.Timeout(600.0, connect=10.0),
+    }
+
+
+def get_client():
+    # Shared client, rebuilt only when the key or endpoint changes. The old
+    # client is left to in-flight requests and closed when garbage collected.
+    global _client, _client_key
+    api_key, base_url = _settings()
+    with _lock:
+        if _client is None or _client_key != (api_key, base_url):
+            from openai import OpenAI, DefaultHttpxClient
+            _client = OpenAI(api_key=api_key, base_url=base_url,
+                             http_client=DefaultHttpxClient(**_pool_options()))
+            _client_key = (api_key, base_url)
+        return _client
+
+
+def get_async_client():
+    # Same pool settings for async callers. httpx async pools are tied to the
+    # event loop, so the loop is part of the key.
+    global _async_client, _async_client_key
+    api_key, base_url = _settings()
+    key = (api_key, base_url, asyncio.get_running_loop())
+    with _lock:
+        if _async_client is None or _async_client_key != key:
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+            _async_client = AsyncOpenAI(api_key=api_key, base_url=base_url,
+                                        http_client=DefaultAsyncHttpxClient(**_pool_options()))
+            _async_client_key = key
+        return _async_client
+
+
+def preload():
+    # Pay for the imports in the background before the first API request
+    importlib.import_module("httpx")
+    importlib.import_module("openai")
@@ -0,0 +1,19 @@
+import atexit
+import threading
+
+import pyaudio
+
+# One PortAudio session for the whole app. Pa_Initialize enumerates every
+# audio device, which takes a noticeable part of a second on some machines,
+# so it happens once, on first use or in the background after startup.
+_lock = threading.Lock()
+_instance = None
+
+
+def get_pyaudio():
+    global _instance
+    with _lock:
+        if _instance is None:
+            _instance = pyaudio.PyAudio()
+            atexit.register(_instance.terminate)
+        return _instance
@@ -3,6 +3,13 @@ import datetime
 class ReportGenerator:
     @staticmethod
     def generate_markdown(segments, output_path=None):
+        output_path = ReportGenerator.start_report(output_path)
+        ReportGenerator.append_segments(output_path, segments)
+        return output_path
+
+    @staticmethod
+    def start_report(output_path=None):
+        # Writes the header; segments can then be appended as they come in
         if output_path is None:
             now = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             output_path = f"Conference_Report_{now}.md"
@@ -11,16 +18,22 @@ class ReportGenerator:
             f.write(f"# Conference Report\n")
             f.write(f"**Date:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
             f.write("---\n\n")
-            
+
+        return output_path
+
+    @staticmethod
+    def append_segments(output_path, segments):
+        if not segments:
+            return
+
+        with open(output_path, "a", encoding="utf-8") as f:
             for seg in segments:
                 time_str = ReportGenerator._format_time(seg['start'])
                 speaker = seg['speaker']
                 text = seg['text']
-                
+
                 # Format: > **[00:15] User**: Hello
                 f.write(f"> **[{time_str}] {speaker}**: {text}\n>\n")
-        
-        return output_path
 
     @staticmethod
     def _format_time(seconds):
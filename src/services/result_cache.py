@@ -0,0 +1,89 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import numpy as np
+
+from src.utils.config import Config
+
+
+class ResultCache:
+    """
+    On-disk transcription results keyed by audio content and decode settings.
+
+    One small JSON file per entry. Hits refresh the file's mtime and the
+    oldest files are removed once the directory grows past `max_mb`, which
+    gives LRU eviction without an index file.
+    """
+
+    def __init__(self, directory=None, max_mb=None):
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "whispertyping_cache")
+        self.max_bytes = (max_mb if max_mb is not None else Config.get_result_cache_mb()) * 1024 * 1024
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def audio_hash(audio):
+        # blake2b over the raw PCM (or file bytes), in blocks so memmaps are not copied
+        h = hashlib.blake2b(digest_size=20)
+        block = 1 << 20
+        if isinstance(audio, np.ndarray):
+            audio = np.ascontiguousarray(audio, dtype=np.float32)
+            for i in range(0, len(audio), block):
+                h.update(memoryview(audio[i:i + block]))
+        else:
+            with open(audio, "rb") as f:
+                for data in iter(lambda: f.read(block), b""):
+                    h.update(data)
+        return h.hexdigest()
+
+    @staticmethod
+    def make_key(audio_hash, **params):
+        blob = json.dumps(params, sort_keys=True, default=str)
+        return audio_hash + "-" + hashlib.blake2b(blob.encode("utf-8"), digest_size=10).hexdigest()
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)["result"]
+            os.utime(path)
+            return result
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key, result):
+        path = self._path(key)
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"result": result}, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Result cache write failed: {e}")
+            return
+        self._evict()
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".json"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
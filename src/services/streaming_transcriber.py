@@ -0,0 +1,168 @@
+import threading
+import numpy as np
+
+from src.services.transcriber import Transcriber
+from src.utils.config import Config
+from src.utils.audio import WHISPER_SAMPLE_RATE
+
+
+class RollingWindow:
+    """
+    The uncommitted audio of one live stream and the text committed from it.
+
+    feed() queues chunks from the capture thread; take_pending() moves them
+    to the tail. step() decodes the whole tail and commits the segments that
+    end more than `holdback_seconds` before its end: their text is kept as
+    decoder context and their audio is dropped, so it is never decoded again.
+    A window past `max_window_seconds` without a settled segment commits all
+    but the last one, and one without speech drops its settled part.
+    """
+
+    def __init__(self, holdback_seconds, max_window_seconds):
+        self.holdback_seconds = holdback_seconds
+        self.max_window_seconds = max_window_seconds
+
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self.fed = False
+        self.tail = np.zeros(0, dtype=np.float32)  # uncommitted audio
+        self.offset = 0.0  # stream time (s) at which the tail starts
+        self.committed = []  # committed text
+        self._decoded_len = 0  # length of the tail when it was last decoded
+
+    def feed(self, data):
+        # Called from the capture thread, keep it cheap
+        with self._pending_lock:
+            self._pending.append(data)
+            self.fed = True
+
+    def take_pending(self):
+        with self._pending_lock:
+            chunks = self._pending
+            self._pending = []
+
+        if not chunks:
+            return False
+
+        self.tail = np.concatenate([self.tail] + chunks)
+        return True
+
+    def due(self, step_samples):
+        # Enough new audio since the last decode to be worth another one
+        return len(self.tail) - self._decoded_len >= step_samples
+
+    def prompt(self):
+        # Previously committed text gives the decoder context across windows
+        return " ".join(self.committed)[-200:] or None
+
+    def step(self, decode):
+        # decode(audio) returns window-relative segments; returns the committed ones on the stream timeline
+        window = self.tail
+        window_seconds = len(window) / WHISPER_SAMPLE_RATE
+        segments = decode(window)
+
+        commit_until = window_seconds - self.holdback_seconds
+        committed = [s for s in segments if s['end'] <= commit_until]
+
+        # Window is getting too long without a settled segment: force progress
+        if not committed and window_seconds > self.max_window_seconds and len(segments) > 1:
+            committed = segments[:-1]
+
+        if committed:
+            cut = int(committed[-1]['end'] * WHISPER_SAMPLE_RATE)
+        elif not segments and commit_until > 0:
+            # Nothing said in this window, the settled part can go
+            cut = int(commit_until * WHISPER_SAMPLE_RATE)
+        else:
+            self._decoded_len = len(window)
+            return []
+
+        committed = self._commit(committed, cut)
+        self._decoded_len = len(window) - cut
+        return committed
+
+    def finish(self, decode):
+        # Decodes whatever is left and commits all of it
+        self.take_pending()
+        if len(self.tail) == 0:
+            return []
+        return self._commit(decode(self.tail), len(self.tail))
+
+    def _commit(self, segments, cut):
+        segments = [{
+            'start': self.offset + s['start'],
+            'end': self.offset + s['end'],
+            'text': s['text'].strip(),
+        } for s in segments if s['text'].strip()]
+
+        self.committed.extend(s['text'] for s in segments)
+        self.tail = self.tail[cut:]
+        self.offset += cut / WHISPER_SAMPLE_RATE
+        return segments
+
+
+class StreamingTranscriber:
+    """
+    Transcribes dictation while it is still being recorded.
+
+    The recorder pushes 16 kHz float32 chunks into feed(). A background thread
+    steps a RollingWindow every `step_seconds`, so settled segments are
+    decoded once and dropped. On finish() only the remaining tail has to be
+    decoded.
+    """
+
+    def __init__(self, language=None, step_seconds=2.0, holdback_seconds=3.0, max_window_seconds=25.0):
+        self.language = language
+        self.step_seconds = step_seconds
+
+        # Windows are decoded once and thrown away, not worth caching
+        self.transcriber = Transcriber(use_cache=False, profile=Config.get_dictation_profile())
+
+        self._window = RollingWindow(holdback_seconds, max_window_seconds)
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+        self._error = None
+
+    def start(self):
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def feed(self, data):
+        self._window.feed(data)
+
+    def finish(self):
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join()
+
+        if self._error:
+            raise self._error
+
+        self._window.finish(self._decode)
+        return " ".join(self._window.committed).strip()
+
+    def _run(self):
+        step_samples = int(self.step_seconds * WHISPER_SAMPLE_RATE)
+
+        while not self._stopping:
+            self._wakeup.wait(timeout=self.step_seconds / 4)
+            if self._stopping:
+                break
+
+            self._window.take_pending()
+            if not self._window.due(step_samples):
+                continue
+
+            try:
+                self._window.step(self._decode)
+            except Exception as e:
+                print(f"Streaming transcription error: {e}")
+                self._error = e
+                return
+
+    def _decode(self, audio):
+        return self.transcriber.transcribe(audio, self.language, return_segments=True,
+                                           initial_prompt=self._window.prompt())
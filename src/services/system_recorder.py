@@ -1,14 +1,18 @@
 import threading
-import soundfile as sf
 import os
 import tempfile
-import numpy as np
+
+from src.services.audio_writer import AudioFileWriter
+from src.services.capture_format import CaptureFormat
+from src.services.chunk_store import ChunkStore
 
 class SystemRecorder:
     def __init__(self):
         self.is_recording = False
-        self.sys_data = [] # List of numpy arrays
+        self.sys_data = ChunkStore() # 16 kHz mono float32, bounded in RAM
         self.sys_thread = None
+        self.sys_writer = None
+        self.sample_rate = 44100
         self.sys_filename = os.path.join(tempfile.gettempdir(), "system_only.wav")
 
     def start_recording(self):
@@ -16,13 +20,15 @@ class SystemRecorder:
             return
         
         self.is_recording = True
-        self.sys_data = []
+        self.sys_data = ChunkStore()
+        self.sys_writer = self._open_writer(self.sys_filename)
         
         self.sys_thread = threading.Thread(target=self._record_system)
         self.sys_thread.start()
         print("System Recording started...")
 
-    def stop_recording(self):
+    def stop_recording(self, to_file=True):
+        # to_file=False skips the WAV round trip and returns a 16 kHz float32 array instead
         if not self.is_recording:
             return None
         
@@ -30,9 +36,26 @@ class SystemRecorder:
         if self.sys_thread:
             self.sys_thread.join()
             
+        # The file was written while recording, only the last blocks are left
+        if self.sys_writer:
+            self.sys_writer.close()
+            self.sys_writer = None
+            
         print("System Recording stopped.")
+        if not to_file:
+            return self.get_audio()
         return self.sys_filename
 
+    def get_audio(self):
+        return self.sys_data.view()
+
+    def _open_writer(self, path):
+        try:
+            return AudioFileWriter(path).start()
+        except Exception as e:
+            print(f"Could not open {path} for writing: {e}")
+            return None
+
     def _record_system(self):
         try:
             import soundcard as sc
@@ -49,17 +72,17 @@ class SystemRecorder:
                 print("No loopback device found. System audio might be silent.")
                 return
 
-            sample_rate = 44100
-            
-            with loopback.recorder(samplerate=sample_rate) as recorder:
+            with loopback.recorder(samplerate=self.sample_rate) as recorder:
+                capture = None
                 while self.is_recording:
                     # Record small chunks
                     data = recorder.record(numframes=1024)
-                    self.sys_data.append(data)
-            
-            if self.sys_data:
-                full_data = np.concatenate(self.sys_data)
-                sf.write(self.sys_filename, full_data, sample_rate)
+                    if capture is None:
+                        capture = CaptureFormat(self.sample_rate, data.shape[1] if data.ndim > 1 else 1)
+                    block = capture.process(data)
+                    self.sys_data.append(block)
+                    if self.sys_writer:
+                        self.sys_writer.write(block)
             
         except Exception as e:
             print(f"System recording error: {e}")
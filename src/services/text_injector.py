@@ -3,6 +3,8 @@ import pyperclip
 import time
 import platform
 
+from src.utils import tracing
+
 class TextInjector:
     def __init__(self):
         self.keyboard = Controller()
@@ -15,21 +17,25 @@ class TextInjector:
         print(f"Injecting text via {modes}: {text}")
 
         # Always do clipboard if requested, or if it's the step for cursor
-        pyperclip.copy(text)
+        with tracing.span("clipboard"):
+            pyperclip.copy(text)
         
         if 'cursor' in modes:
             # Small delay to ensure clipboard is ready
-            time.sleep(0.1)
+            with tracing.span("paste_delay"):
+                time.sleep(0.1)
             
             modifier = Key.ctrl
             if platform.system() == 'Darwin':
                 modifier = Key.cmd
             
-            with self.keyboard.pressed(modifier):
-                self.keyboard.press('v')
-                self.keyboard.release('v')
+            with tracing.span("paste"):
+                with self.keyboard.pressed(modifier):
+                    self.keyboard.press('v')
+                    self.keyboard.release('v')
         
             if append_enter:
-                 time.sleep(0.1)
-                 self.keyboard.press(Key.enter)
-                 self.keyboard.release(Key.enter)
+                 with tracing.span("enter"):
+                     time.sleep(0.1)
+                     self.keyboard.press(Key.enter)
+                     self.keyboard.release(Key.enter)
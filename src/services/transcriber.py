@@ -1,138 +1,473 @@
-from openai import OpenAI
 from src.utils.config import Config
+from src.services.openai_client import get_client, get_async_client
+from src.services.inference_server import get_inference_client
+from src.services.model_cache import ModelCache
+from src.services.vad import VoiceActivityDetector, OffsetMap
+from src.services.result_cache import ResultCache
+from src.services.decoding_profiles import DEFAULT_PROFILE, get_profile, decode_options
+from src.utils.audio import WHISPER_SAMPLE_RATE, encode_wav
+from src.utils import tracing
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import os
 import threading
 
+# Dictation, conference and streaming share one local model that can serve
+# this many transcribe() calls at once (both conference tracks, queued dictations)
+SHARED_NUM_WORKERS = 2
+
 class Transcriber:
-    _local_model = None
-    _local_model_name = None
-    _model_lock = threading.Lock()
+    _device = None
+    _device_lock = threading.Lock()
+    _model_cache = None
+    _result_cache = None
+    # After a model size change the old model stays active until the new one is loaded
+    _size_lock = threading.Lock()
+    _active_size = None
+    _switching = None
+    # Cleared at startup on Windows when CTranslate2 was not loaded before Qt;
+    # local decoding in this process would then crash, so it goes to the worker
+    in_process_safe = True
+
+    def __init__(self, model_size=None, num_workers=SHARED_NUM_WORKERS, cpu_threads=0, use_cache=True, profile=None):
+        # None means the configured LOCAL_MODEL_SIZE. num_workers > 1 lets the
+        # local model serve that many transcribe() calls in parallel, each on
+        # cpu_threads threads (0 = CTranslate2 default). use_cache=False skips
+        # the on-disk result cache (e.g. for throwaway streaming windows).
+        # profile names a decoding profile ('fastest', 'balanced', 'accurate').
+        self.model_size = model_size
+        self.num_workers = num_workers
+        self.cpu_threads = cpu_threads
+        self.use_cache = use_cache
+        self.profile = profile or DEFAULT_PROFILE
+        self.vad = VoiceActivityDetector(**get_profile(self.profile)["vad"])
+
+    def transcribe(self, audio_path, language=None, return_segments=False, initial_prompt=None):
+        # audio_path is either a file path or an in-memory 16 kHz mono float32 numpy array
+        with tracing.span("cache_lookup"):
+            cache_key = self._cache_key(audio_path, language, return_segments, initial_prompt)
+            cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._transcribe_uncached(audio_path, language, return_segments, initial_prompt)
+        with tracing.span("cache_store"):
+            self._cache_put(cache_key, result)
+        return result
 
-    def __init__(self):
-        pass
+    def _transcribe_uncached(self, audio_path, language, return_segments, initial_prompt):
+        audio_path, offsets = self._prepare_audio(audio_path)
+        if isinstance(audio_path, np.ndarray) and len(audio_path) == 0:
+            return [] if return_segments else ""
 
-    def transcribe(self, audio_path, language=None, return_segments=False):
         backend = Config.get_transcriber_backend()
         
         if backend == "local":
-            return self._transcribe_local(audio_path, language, return_segments)
+            result = self._transcribe_local(audio_path, language, return_segments, initial_prompt)
         else:
-            return self._transcribe_api(audio_path, language, return_segments)
+            result = self._transcribe_api(audio_path, language, return_segments, initial_prompt)
 
-    def _transcribe_api(self, audio_path, language=None, return_segments=False):
-        api_key = Config.get_openai_api_key()
-        if not api_key:
-            raise ValueError("OpenAI API Key is missing. Please set it in Settings.")
+        return self._map_result(result, offsets, return_segments)
 
-        client = OpenAI(api_key=api_key)
-        
-        if not os.path.exists(audio_path):
-             raise FileNotFoundError(f"Audio file not found: {audio_path}")
-        
+    async def transcribe_async(self, audio_path, language=None, return_segments=False, initial_prompt=None):
+        # API requests share one pooled async client, so many can be in flight at once.
+        # The local backend runs in a worker thread.
+        if Config.get_transcriber_backend() == "local":
+            return await asyncio.to_thread(self.transcribe, audio_path, language, return_segments, initial_prompt)
+
+        cache_key = self._cache_key(audio_path, language, return_segments, initial_prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        audio_path, offsets = self._prepare_audio(audio_path)
+        if isinstance(audio_path, np.ndarray) and len(audio_path) == 0:
+            return [] if return_segments else ""
+
+        result = await self._transcribe_api_async(audio_path, language, return_segments, initial_prompt)
+        result = self._map_result(result, offsets, return_segments)
+        self._cache_put(cache_key, result)
+        return result
+
+    def _prepare_audio(self, audio):
+        offsets = None
+        if isinstance(audio, np.ndarray) and Config.get_vad_enabled():
+            # Only decode the speech; timestamps are mapped back afterwards
+            with tracing.span("vad"):
+                audio, offsets = self.vad.trim(audio)
+        return audio, offsets
+
+    def _map_result(self, result, offsets, return_segments):
+        # Segments always come back as plain dicts on the original timeline
+        if return_segments:
+            result = (offsets or OffsetMap([])).map_segments(result)
+        return result
+
+    def _cache_key(self, audio, language, return_segments, initial_prompt):
+        if not self.use_cache or not Config.get_result_cache_enabled():
+            return None
+        if not isinstance(audio, np.ndarray) and not os.path.exists(audio):
+            return None
+
+        backend = Config.get_transcriber_backend()
+        model = (self.model_size or self.active_model_size()) if backend == "local" else "whisper-1"
+        return ResultCache.make_key(
+            ResultCache.audio_hash(audio),
+            backend=backend,
+            model=model,
+            language=language,
+            segments=return_segments,
+            prompt=initial_prompt,
+            vad=Config.get_vad_enabled(),
+            profile=self.profile,
+            decode=decode_options(self.profile, return_segments),
+        )
+
+    @classmethod
+    def _get_result_cache(cls):
+        with cls._device_lock:
+            if cls._result_cache is None:
+                cls._result_cache = ResultCache()
+            return cls._result_cache
+
+    def _cache_get(self, key):
+        if key is None:
+            return None
+        result = self._get_result_cache().get(key)
+        if result is not None:
+            print("Using cached transcription result")
+        return result
+
+    def _cache_put(self, key, result):
+        if key is not None:
+            self._get_result_cache().put(key, result)
+
+    def _transcribe_api(self, audio_path, language=None, return_segments=False, initial_prompt=None):
+        if isinstance(audio_path, np.ndarray) and len(audio_path) > Config.get_api_chunk_seconds() * WHISPER_SAMPLE_RATE:
+            return self._transcribe_api_split(audio_path, language, return_segments, initial_prompt)
+
+        # Process-wide client: connections stay open between dictations
+        client = get_client()
+        args = self._api_args(language, return_segments, initial_prompt)
+            
+        try:
+            if isinstance(audio_path, np.ndarray):
+                with tracing.span("encode_wav"):
+                    args["file"] = self._api_file(audio_path)
+                with tracing.span("api_request"):
+                    transcript = client.audio.transcriptions.create(**args)
+            else:
+                if not os.path.exists(audio_path):
+                    raise FileNotFoundError(f"Audio file not found: {audio_path}")
+                with open(audio_path, "rb") as audio_file:
+                    args["file"] = audio_file
+                    with tracing.span("api_request"):
+                        transcript = client.audio.transcriptions.create(**args)
+            
+            return self._api_result(transcript, return_segments)
+        except Exception as e:
+            print(f"API Transcription error: {e}")
+            raise e
+
+    def _transcribe_api_split(self, audio, language, return_segments, initial_prompt):
+        # Long audio: cut at quiet points into pieces below the upload limit and
+        # send them concurrently. Wall time becomes roughly the slowest piece.
+        spans = self.vad.split(audio, Config.get_api_chunk_seconds())
+        workers = min(len(spans), Config.get_api_parallelism())
+        print(f"Uploading {len(spans)} chunks, {workers} at a time...")
+
+        with tracing.span("api_parallel_upload"), ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self._transcribe_api, audio[start:end], language, return_segments,
+                            initial_prompt if i == 0 else None)
+                for i, (start, end) in enumerate(spans)
+            ]
+            results = [f.result() for f in futures]
+
+        return self._merge_api_pieces(spans, results, return_segments)
+
+    async def _transcribe_api_async(self, audio_path, language, return_segments, initial_prompt):
+        if isinstance(audio_path, np.ndarray) and len(audio_path) > Config.get_api_chunk_seconds() * WHISPER_SAMPLE_RATE:
+            return await self._transcribe_api_split_async(audio_path, language, return_segments, initial_prompt)
+
+        args = self._api_args(language, return_segments, initial_prompt)
+        args["file"] = self._api_file(audio_path)
+        try:
+            with tracing.span("api_request"):
+                transcript = await get_async_client().audio.transcriptions.create(**args)
+        except Exception as e:
+            print(f"API Transcription error: {e}")
+            raise e
+        return self._api_result(transcript, return_segments)
+
+    async def _transcribe_api_split_async(self, audio, language, return_segments, initial_prompt):
+        # Same cut as _transcribe_api_split, with at most API_PARALLELISM pieces in flight on the async pool
+        spans = self.vad.split(audio, Config.get_api_chunk_seconds())
+        limit = asyncio.Semaphore(Config.get_api_parallelism())
+        print(f"Uploading {len(spans)} chunks, {min(len(spans), Config.get_api_parallelism())} at a time...")
+
+        async def upload(i, start, end):
+            async with limit:
+                return await self._transcribe_api_async(audio[start:end], language, return_segments,
+                                                        initial_prompt if i == 0 else None)
+
+        with tracing.span("api_parallel_upload"):
+            results = await asyncio.gather(*(upload(i, start, end) for i, (start, end) in enumerate(spans)))
+        return self._merge_api_pieces(spans, results, return_segments)
+
+    @staticmethod
+    def _merge_api_pieces(spans, results, return_segments):
+        if not return_segments:
+            return " ".join(r.strip() for r in results if r).strip()
+
+        # Shift each piece's segments by where the piece starts
+        merged = []
+        for (start, end), segments in zip(spans, results):
+            merged.extend(OffsetMap([(start, end)]).map_segments(segments))
+        return merged
+
+    def _api_args(self, language, return_segments, initial_prompt):
         if language == "Auto":
             language = None
             
         args = {
-            "model": "whisper-1",
-            "file": open(audio_path, "rb") 
+            "model": "whisper-1"
         }
         
         if return_segments:
             args["response_format"] = "verbose_json"
+        if language:
+            args["language"] = language
+        if initial_prompt:
+            args["prompt"] = initial_prompt
+        return args
+
+    def _api_file(self, audio):
+        if isinstance(audio, np.ndarray):
+            # Upload straight from memory, no temp file needed
+            return ("audio.wav", encode_wav(audio))
+        if not os.path.exists(audio):
+            raise FileNotFoundError(f"Audio file not found: {audio}")
+        with open(audio, "rb") as f:
+            return (os.path.basename(audio), f.read())
+
+    def _api_result(self, transcript, return_segments):
+        if return_segments:
+            return getattr(transcript, 'segments', None) or []
+        return transcript.text
+
+    @classmethod
+    def get_local_model(cls, model_size=None, cpu_threads=0, num_workers=SHARED_NUM_WORKERS):
+        # Returns a loaded WhisperModel for the given (or configured) size
+        return cls._get_model_cache().get(cls.model_key(model_size, cpu_threads, num_workers))
+
+    @classmethod
+    def prefetch_local_model(cls):
+        # Load the newly configured model in the background. Requests keep using
+        # the active model and switch over once the new one is in the cache.
+        size = Config.get_local_model_size()
+        with cls._size_lock:
+            if cls._active_size in (None, size):
+                # Nothing to switch from (or switching back): use it right away
+                cls._active_size = size
+                cls._switching = None
+                return
+            cls._switching = size
+
+        on_done = functools.partial(cls._switched, size)
+        if cls.uses_worker():
+            get_inference_client().prefetch(cls.model_spec(size), on_done)
+        else:
+            cls._get_model_cache().prefetch(cls.model_key(size), on_done)
+
+    @classmethod
+    def _switched(cls, size, ok):
+        with cls._size_lock:
+            if cls._switching != size:
+                return  # superseded by a later change
+            cls._switching = None
+            if ok:
+                cls._active_size = size
+                print(f"Switched to model {size}")
+
+    @classmethod
+    def active_model_size(cls):
+        # The configured size, unless a switch to it is still loading
+        configured = Config.get_local_model_size()
+        with cls._size_lock:
+            if cls._switching != configured or cls._active_size is None:
+                cls._active_size = configured
+            return cls._active_size
+
+    @classmethod
+    def uses_worker(cls):
+        # Local decoding runs in the inference process
+        return Config.get_inference_process() or not cls.in_process_safe
+
+    @classmethod
+    def has_loaded_models(cls):
+        if cls.uses_worker():
+            return get_inference_client().is_running()
+        return cls._model_cache is not None and len(cls._model_cache) > 0
+
+    @classmethod
+    def model_spec(cls, model_size=None, cpu_threads=0, num_workers=SHARED_NUM_WORKERS):
+        # Which model a caller wants, without touching CTranslate2 (safe in the UI process)
+        return (model_size or cls.active_model_size(), cpu_threads, num_workers)
+
+    @classmethod
+    def resolve_key(cls, spec):
+        # Model cache key for a spec, on whichever process runs the model
+        model_size, cpu_threads, num_workers = spec
+        device, compute_type = cls._detect_device()
+        if device == "cuda":
+            cpu_threads = 0
+        elif cpu_threads == 0:
+            cpu_threads = Config.get_tuned_cpu_threads()
+        return (model_size, device, compute_type, cpu_threads, num_workers)
+
+    @classmethod
+    def model_key(cls, model_size=None, cpu_threads=0, num_workers=SHARED_NUM_WORKERS):
+        return cls.resolve_key(cls.model_spec(model_size, cpu_threads, num_workers))
+
+    @classmethod
+    def _get_model_cache(cls):
+        budget_mb = Config.get_model_cache_mb()
+        idle_seconds = Config.get_model_idle_minutes() * 60
+        with cls._device_lock:
+            if cls._model_cache is None:
+                cls._model_cache = ModelCache(cls._load_model, budget_mb, idle_seconds)
+            else:
+                cls._model_cache.configure(budget_mb, idle_seconds)
+            return cls._model_cache
+
+    @classmethod
+    def _detect_device(cls):
+        with cls._device_lock:
+            if cls._device is not None:
+                return cls._device
+
+            import ctranslate2
+
+            # Windows DLL Fix: Add nvidia libs to PATH
+            if os.name == 'nt':
+                import site
+                try:
+                    # Add site-packages/nvidia/*/bin to PATH
+                    for p in site.getsitepackages():
+                        nvidia_dir = os.path.join(p, "nvidia")
+                        if os.path.exists(nvidia_dir):
+                             for root, dirs, files in os.walk(nvidia_dir):
+                                 if 'bin' in dirs:
+                                     bin_path = os.path.join(root, 'bin')
+                                     if bin_path not in os.environ["PATH"]:
+                                         os.environ["PATH"] += os.pathsep + bin_path
+                                         print(f"Added DLL path: {bin_path}", flush=True)
+                except Exception as e:
+                    print(f"Warning: Failed to patch DLL paths: {e}", flush=True)
+
+            print("Checking for CUDA device...", flush=True)
+            cuda_count = ctranslate2.get_cuda_device_count()
+            print(f"CUDA count: {cuda_count}", flush=True)
             
-        try:
-            with open(audio_path, "rb") as audio_file:
-                args["file"] = audio_file
-                if language:
-                    args["language"] = language
-                
-                transcript = client.audio.transcriptions.create(**args)
+            device = "cuda" if cuda_count > 0 else "cpu"
             
-            if return_segments:
-                return getattr(transcript, 'segments', [])
+            # RTX 5090 (CC 12.0) detection issue with INT8 in CTranslate2 4.x
+            if device == "cuda":
+                compute_type = "float16"
             else:
-                return transcript.text
-        except Exception as e:
-            print(f"API Transcription error: {e}")
-            raise e
+                compute_type = "int8"
 
-    def _transcribe_local(self, audio_path, language=None, return_segments=False):
+            # Calibrated settings win, unless the hardware they were measured on is gone
+            tuned_type = Config.get_tuned_compute_type()
+            if tuned_type and Config.get_tuned_device() == device:
+                compute_type = tuned_type
+
+            cls._device = (device, compute_type)
+            return cls._device
+
+    @classmethod
+    def reset_device(cls):
+        # Re-read calibrated settings on the next model request
+        with cls._device_lock:
+            cls._device = None
+
+    @staticmethod
+    def _load_model(key):
         from faster_whisper import WhisperModel
-        import ctranslate2
 
-        model_size = Config.get_local_model_size()
+        model_size, device, compute_type, cpu_threads, num_workers = key
+        print(f"Loading local faster-whisper model: {model_size}...", flush=True)
+        print(f"Using device: {device}, compute_type: {compute_type}", flush=True)
         
+        try:
+            print("Initializing WhisperModel...", flush=True)
+            try:
+                model = WhisperModel(model_size, device=device, compute_type=compute_type,
+                                     cpu_threads=cpu_threads, num_workers=num_workers)
+            except Exception as e:
+                 print(f"Initial load failed with {compute_type}, retrying with 'default'...", flush=True)
+                 model = WhisperModel(model_size, device=device, compute_type="default",
+                                     cpu_threads=cpu_threads, num_workers=num_workers)
+                 print(f"Loaded with compute_type {Transcriber.loaded_compute_type(model)}", flush=True)
+
+            print("Model loaded successfully.", flush=True)
+            return model
+        except Exception as e:
+            print(f"FAILED to load model: {e}", flush=True)
+            import traceback
+            traceback.print_exc()
+            raise e
+
+    @staticmethod
+    def loaded_compute_type(model):
+        # Compute type CTranslate2 actually runs the model with (None if unknown)
+        return getattr(getattr(model, "model", None), "compute_type", None)
+
+    @staticmethod
+    def compute_type_matches(requested, loaded):
+        # 'int8' resolves to 'int8_float32' / 'int8_float16' depending on the device
+        return loaded is None or loaded == requested or loaded.startswith(requested + "_")
+
+    @classmethod
+    def warm_up(cls, model_size=None, cpu_threads=0, num_workers=SHARED_NUM_WORKERS):
+        # Load the model and run one short decode so the first real request
+        # does not pay for lazy initialisation
+        spec = cls.model_spec(model_size, cpu_threads, num_workers)
+        if cls.uses_worker():
+            get_inference_client().warm_up(spec)
+            return
+        cls.warm_up_model(cls._get_model_cache().get(cls.resolve_key(spec)))
+
+    @staticmethod
+    def warm_up_model(model):
+        segments, _ = model.transcribe(np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32), beam_size=1, language="en")
+        list(segments)
+
+    def _transcribe_local(self, audio_path, language=None, return_segments=False, initial_prompt=None):
         if language == "Auto":
             language = None
 
-        # Windows DLL Fix: Add nvidia libs to PATH
-        if os.name == 'nt':
-            import site
-            try:
-                # Add site-packages/nvidia/*/bin to PATH
-                for p in site.getsitepackages():
-                    nvidia_dir = os.path.join(p, "nvidia")
-                    if os.path.exists(nvidia_dir):
-                         for root, dirs, files in os.walk(nvidia_dir):
-                             if 'bin' in dirs:
-                                 bin_path = os.path.join(root, 'bin')
-                                 if bin_path not in os.environ["PATH"]:
-                                     os.environ["PATH"] += os.pathsep + bin_path
-                                     print(f"Added DLL path: {bin_path}", flush=True)
-            except Exception as e:
-                print(f"Warning: Failed to patch DLL paths: {e}", flush=True)
+        spec = self.model_spec(self.model_size, self.cpu_threads, self.num_workers)
+        options = decode_options(self.profile, return_segments)
+        batch_size = Config.get_long_form_batch_size() if self._use_long_form(audio_path) else 0
+        print(f"Starting local transcription ({self.profile})...")
 
-        with self._model_lock:
-            if Transcriber._local_model is None or Transcriber._local_model_name != model_size:
-                print(f"Loading local faster-whisper model: {model_size}...", flush=True)
-                
-                try:
-                    import ctypes
-                    
-                    print("Checking for CUDA device...", flush=True)
-                    cuda_count = ctranslate2.get_cuda_device_count()
-                    print(f"CUDA count: {cuda_count}", flush=True)
-                    
-                    device = "cuda" if cuda_count > 0 else "cpu"
-                    
-                    # Windows specific check for zlibwapi (Removed to avoid false negatives)
-                    # if device == "cuda" and os.name == 'nt': ... (User confirmed DLL exists)
-
-                
-                    # RTX 5090 (CC 12.0) detection issue with INT8 in CTranslate2 4.x
-                    if device == "cuda":
-                        compute_type = "float16"
-                    else:
-                        compute_type = "int8"
-                    
-                    print(f"Using device: {device}, compute_type: {compute_type}", flush=True)
-                    
-                    print("Initializing WhisperModel...", flush=True)
-                    try:
-                        Transcriber._local_model = WhisperModel(model_size, device=device, compute_type=compute_type)
-                    except Exception as e:
-                         print(f"Initial load failed with {compute_type}, retrying with 'default'...", flush=True)
-                         Transcriber._local_model = WhisperModel(model_size, device=device, compute_type="default")
-
-                         
-                    Transcriber._local_model_name = model_size
-                    print("Model loaded successfully.", flush=True)
-                except Exception as e:
-                    print(f"FAILED to load model: {e}", flush=True)
-                    import traceback
-                    traceback.print_exc()
-                    raise e
-        
-        print("Starting local transcription...")
-        
-        segments_generator, info = Transcriber._local_model.transcribe(
-            audio_path, 
-            beam_size=5, 
-            language=language
-        )
-        
-        # faster-whisper returns a generator, so we must consume it here
-        segments = list(segments_generator)
+        if self.uses_worker():
+            # Model runs in the worker process; a native crash there fails only this job
+            with tracing.span("decode_remote"):
+                segments = get_inference_client().transcribe(spec, audio_path, language, initial_prompt,
+                                                              options, batch_size)
+        else:
+            with tracing.span("model_load"):
+                model = self._get_model_cache().get(self.resolve_key(spec))
+            
+            with tracing.span("decode_batched" if batch_size else "decode"):
+                # faster-whisper returns a generator, so we must consume it here
+                segments = list(self.decode_segments(model, audio_path, language, initial_prompt,
+                                                     options, batch_size))
         
         if return_segments:
             # Normalize to match API/prev structure (dicts mostly)
@@ -149,3 +484,45 @@ class Transcriber:
             # Join text
             text = " ".join([s.text for s in segments])
             return text.strip()
+
+    def _use_long_form(self, audio):
+        if not isinstance(audio, np.ndarray):
+            return False
+        if Config.get_long_form_batch_size() < 2:
+            return False
+        return len(audio) >= Config.get_long_form_min_seconds() * WHISPER_SAMPLE_RATE
+
+    @staticmethod
+    def decode_segments(model, audio, language, initial_prompt, options, batch_size=0):
+        # Yields faster-whisper segments as they are decoded. batch_size >= 2
+        # switches to batched long-form decoding, whose segments arrive at the end.
+        if batch_size < 2:
+            segments_generator, info = model.transcribe(audio, language=language,
+                                                        initial_prompt=initial_prompt, **options)
+            yield from segments_generator
+            return
+
+        # Long recordings: cut into <= 30 s chunks at quiet points and decode
+        # the chunks in batches. Segment times come back absolute.
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            print("BatchedInferencePipeline not available, falling back to sequential decoding")
+            segments_generator, info = model.transcribe(audio, language=language,
+                                                        initial_prompt=initial_prompt, **options)
+            yield from segments_generator
+            return
+
+        clips = [{'start': s / WHISPER_SAMPLE_RATE, 'end': e / WHISPER_SAMPLE_RATE}
+                 for s, e in VoiceActivityDetector().split(audio, 30.0)]
+        print(f"Starting batched local transcription: {len(clips)} chunks, batch size {batch_size}...")
+
+        pipeline = BatchedInferencePipeline(model=model)
+        segments_generator, info = pipeline.transcribe(
+            audio,
+            language=language,
+            batch_size=batch_size,
+            clip_timestamps=clips,
+            **options
+        )
+        yield from sorted(segments_generator, key=lambda s: s.start)
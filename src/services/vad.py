@@ -0,0 +1,147 @@
+import numpy as np
+
+from src.utils.audio import WHISPER_SAMPLE_RATE
+
+
+class OffsetMap:
+    """
+    Maps times in trimmed audio back to the original recording.
+
+    Built from the kept spans (in samples of the original audio); the spans are
+    laid end to end in the trimmed audio.
+    """
+
+    def __init__(self, spans, rate=WHISPER_SAMPLE_RATE):
+        spans = np.asarray(spans, dtype=np.int64).reshape(-1, 2)
+        lengths = spans[:, 1] - spans[:, 0]
+        self.orig_starts = spans[:, 0] / rate
+        self.trim_starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]) / rate
+        self.trim_ends = np.cumsum(lengths) / rate
+
+    def to_original(self, t, is_end=False):
+        if len(self.orig_starts) == 0:
+            return t
+        # An end time that falls exactly on a cut belongs to the earlier span
+        side = 'left' if is_end else 'right'
+        i = max(0, np.searchsorted(self.trim_starts, t, side=side) - 1)
+        return float(self.orig_starts[i] + (t - self.trim_starts[i]))
+
+    def map_segments(self, raw_segments):
+        # Accepts local dicts or API segment objects, returns dicts on the original timeline
+        mapped = []
+        for s in raw_segments:
+            if hasattr(s, 'start'):
+                start, end, text = s.start, s.end, s.text
+            else:
+                start, end, text = s.get('start', 0), s.get('end', 0), s.get('text', "")
+            mapped.append({
+                'start': self.to_original(start),
+                'end': self.to_original(end, is_end=True),
+                'text': text
+            })
+        return mapped
+
+
+class VoiceActivityDetector:
+    """
+    Frame energy + zero-crossing rate voice activity detection.
+
+    Frames louder than the adaptive noise floor are speech; quieter frames with
+    a fricative-like zero-crossing rate are kept too so unvoiced consonants are
+    not clipped. Short blips are dropped, speech runs are padded, and gaps
+    shorter than `merge_gap_ms` are bridged.
+    """
+
+    def __init__(self, rate=WHISPER_SAMPLE_RATE, frame_ms=30, min_speech_ms=90, pad_ms=300,
+                 merge_gap_ms=600, silence_dbfs=-50.0, min_total_ms=300):
+        self.rate = rate
+        self.frame_len = int(rate * frame_ms / 1000)
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.pad_frames = pad_ms // frame_ms
+        self.merge_gap_frames = merge_gap_ms // frame_ms
+        self.silence_dbfs = silence_dbfs
+        self.min_total = int(rate * min_total_ms / 1000)
+
+    def speech_spans(self, audio):
+        # Returns a (n, 2) array of [start, end) sample indices
+        db, zcr = self._frame_features(audio)
+        if len(db) == 0 or db.max() < self.silence_dbfs:
+            return np.zeros((0, 2), dtype=np.int64)
+
+        noise_floor = np.percentile(db, 10)
+        loud = db > max(noise_floor + 10.0, self.silence_dbfs)
+        fricative = (db > max(noise_floor + 4.0, self.silence_dbfs)) & (zcr > 0.25) & (zcr < 0.6)
+        mask = self._drop_short_runs(loud | fricative)
+
+        if self.pad_frames:
+            kernel = np.ones(2 * self.pad_frames + 1)
+            mask = np.convolve(mask, kernel, mode='same') > 0
+
+        starts, ends = self._runs(mask)
+        if len(starts) > 1:
+            # Bridge short pauses so words are not cut apart
+            split = (starts[1:] - ends[:-1]) >= self.merge_gap_frames
+            starts = starts[np.concatenate([[True], split])]
+            ends = ends[np.concatenate([split, [True]])]
+
+        spans = np.stack([starts, ends], axis=1) * self.frame_len
+        if len(spans) and ends[-1] == len(mask):
+            # Speech runs into the end, keep the trailing partial frame too
+            spans[-1, 1] = len(audio)
+        return spans
+
+    def trim(self, audio):
+        # Returns (speech_only_audio, OffsetMap); the audio is empty for near-silent input
+        spans = self.speech_spans(audio)
+        if int((spans[:, 1] - spans[:, 0]).sum()) < self.min_total:
+            return np.zeros(0, dtype=np.float32), OffsetMap(np.zeros((0, 2)), self.rate)
+
+        trimmed = np.concatenate([audio[s:e] for s, e in spans]).astype(np.float32, copy=False)
+        return trimmed, OffsetMap(spans, self.rate)
+
+    def split(self, audio, max_seconds=30.0):
+        # Cuts audio into consecutive [start, end) spans of at most max_seconds,
+        # each cut placed at the quietest frame in the second half of the window
+        max_frames = int(max_seconds * self.rate) // self.frame_len
+        if len(audio) <= max_frames * self.frame_len:
+            return [(0, len(audio))]
+
+        db, _ = self._frame_features(audio)
+        cuts = [0]
+        pos = 0
+        while len(audio) - pos * self.frame_len > max_frames * self.frame_len:
+            lo = pos + max_frames // 2
+            hi = min(len(db), pos + max_frames)
+            pos = lo + int(np.argmin(db[lo:hi]))
+            cuts.append(pos * self.frame_len)
+
+        cuts.append(len(audio))
+        return list(zip(cuts[:-1], cuts[1:]))
+
+    def _frame_features(self, audio, block_frames=20000):
+        # Works through long (memmapped) recordings in blocks to bound memory
+        n = len(audio) // self.frame_len
+        db = np.empty(n, dtype=np.float32)
+        zcr = np.empty(n, dtype=np.float32)
+        for b in range(0, n, block_frames):
+            e = min(n, b + block_frames)
+            frames = np.asarray(audio[b * self.frame_len:e * self.frame_len], dtype=np.float32)
+            frames = frames.reshape(e - b, self.frame_len)
+            rms = np.sqrt(np.mean(frames * frames, axis=1) + 1e-12)
+            db[b:e] = 20 * np.log10(rms)
+            signs = np.signbit(frames)
+            zcr[b:e] = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / self.frame_len
+        return db, zcr
+
+    def _drop_short_runs(self, mask):
+        starts, ends = self._runs(mask)
+        keep = (ends - starts) >= self.min_speech_frames
+        delta = np.zeros(len(mask) + 1, dtype=np.int32)
+        np.add.at(delta, starts[keep], 1)
+        np.add.at(delta, ends[keep], -1)
+        return np.cumsum(delta[:-1]) > 0
+
+    @staticmethod
+    def _runs(mask):
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], mask.astype(np.int8), [0]])))
+        return edges[0::2], edges[1::2]
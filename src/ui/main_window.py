@@ -1,3 +1,4 @@
+import queue
 import threading
 import sys
 import os
@@ -11,89 +12,181 @@ from src.ui.settings_window import SettingsWindow
 from src.ui.styles import Styles
 from src.services.audio_recorder import AudioRecorder
 from src.services.transcriber import Transcriber
+from src.services.streaming_transcriber import StreamingTranscriber
 from src.services.text_injector import TextInjector
 from src.services.hotkey_manager import HotkeyManager
 from src.utils.config import Config
+from src.utils import tracing
 
 # V3/V5 Imports
 from src.services.conference_recorder import ConferenceRecorder
 from src.services.conference_transcriber import ConferenceTranscriber
+from src.services.live_conference_transcriber import LiveConferenceTranscriber
 from src.services.report_generator import ReportGenerator
 from src.services.system_recorder import SystemRecorder
+from src.services.auto_tuner import quick_probe
 
-class AudioProcessingThread(QThread):
-    finished = pyqtSignal(str)
-    error = pyqtSignal(str)
+class TranscriptionPipeline(QObject):
+    """
+    Persistent workers fed by a FIFO queue of finished recordings.
+
+    Utterance N is transcribed while N+1 is being recorded. Workers keep their
+    Transcribers and share one TextInjector, and text is injected strictly in
+    recording order: a worker that finishes early waits for its turn.
+    """
+    finished = pyqtSignal(object, str)  # tracing job, text
+    error = pyqtSignal(object, str)
+
+    WORKERS = 2
 
-    def __init__(self, audio_file):
+    def __init__(self):
         super().__init__()
-        self.audio_file = audio_file
-        self.transcriber = Transcriber()
-        self.injector = TextInjector()
+        self.jobs = queue.Queue()
+        self.injector = None
+        self._turn = threading.Condition()
+        self._submitted = 0
+        self._injected = 0
+        for i in range(self.WORKERS):
+            threading.Thread(target=self._work, name=f"transcription-{i}", daemon=True).start()
 
-    def run(self):
-        try:
-            language = Config.get_language()
-            print(f"Transcribing with language: {language}")
-            
-            text = self.transcriber.transcribe(self.audio_file, language=language)
-            print(f"Transcribed: {text}")
-            
-            modes = Config.get_output_modes()
-            # Standard mode: don't auto-enter
-            self.injector.inject(text, modes, append_enter=False)
-            
-            self.finished.emit(text)
-        except Exception as e:
-            self.error.emit(str(e))
+    @property
+    def pending(self):
+        with self._turn:
+            return self._submitted - self._injected
 
-class InterviewProcessingThread(QThread):
-    finished = pyqtSignal(str)
-    error = pyqtSignal(str)
+    def submit(self, kind, source, job=None):
+        # kind is 'dictation', 'streaming' or 'interview'; source is the audio
+        # (file path or 16 kHz float32 array) or the StreamingTranscriber
+        with self._turn:
+            seq = self._submitted
+            self._submitted += 1
+        if job:
+            job.begin("queue_wait")
+        self.jobs.put((seq, kind, source, job))
 
-    def __init__(self, audio_file):
-        super().__init__()
-        self.audio_file = audio_file
-        self.transcriber = Transcriber()
-        self.injector = TextInjector()
+    def _work(self):
+        transcribers = {}  # profile -> Transcriber, private to this worker
+        while True:
+            seq, kind, source, job = self.jobs.get()
+            with tracing.activate(job):
+                tracing.end("queue_wait")
+                text, error = "", None
+                try:
+                    text = self._transcribe(kind, source, transcribers)
+                except Exception as e:
+                    error = str(e)
 
-    def run(self):
-        try:
-            language = Config.get_language()
-            print(f"Interview Mode: Transcribing system audio...")
-            
-            text = self.transcriber.transcribe(self.audio_file, language=language)
-            print(f"Transcribed System: {text}")
-            
-            modes = ["cursor"] # Interview mode forces typing
-            # Auto-Enter is TRUE
-            self.injector.inject(text, modes, append_enter=True)
-            
-            self.finished.emit(text)
-        except Exception as e:
-            self.error.emit(str(e))
+                with tracing.span("inject_wait"), self._turn:
+                    self._turn.wait_for(lambda: self._injected == seq)
+                try:
+                    if error is None:
+                        with tracing.span("inject"):
+                            self._inject(kind, text)
+                except Exception as e:
+                    error = str(e)
+                finally:
+                    # Emit before handing over the turn so the UI sees results in order
+                    tracing.begin("signal_delivery")
+                    if error is None:
+                        self.finished.emit(job, text)
+                    else:
+                        self.error.emit(job, error)
+                    with self._turn:
+                        self._injected += 1
+                        self._turn.notify_all()
+
+    def _transcribe(self, kind, source, transcribers):
+        if kind == "streaming":
+            # Most of the audio was already transcribed during recording
+            with tracing.span("stream_finish"):
+                text = source.finish()
+            print(f"Transcribed (streaming): {text}")
+            return text
+
+        language = Config.get_language()
+        if kind == "interview":
+            print("Interview Mode: Transcribing system audio...")
+            profile = Config.get_interview_profile()
+        else:
+            print(f"Transcribing with language: {language}")
+            profile = Config.get_dictation_profile()
+        if profile not in transcribers:
+            transcribers[profile] = Transcriber(profile=profile)
+
+        with tracing.span("transcribe"):
+            text = transcribers[profile].transcribe(source, language=language)
+        print(f"Transcribed: {text}")
+        return text
+
+    def _inject(self, kind, text):
+        # Only called by the worker holding the turn
+        if self.injector is None:
+            self.injector = TextInjector()
+        if kind == "interview":
+            # Interview mode forces typing and auto-Enter
+            self.injector.inject(text, ["cursor"], append_enter=True)
+        else:
+            # Standard mode: don't auto-enter
+            self.injector.inject(text, Config.get_output_modes(), append_enter=False)
 
 class ConferenceProcessingThread(QThread):
-    finished = pyqtSignal(str)
-    error = pyqtSignal(str)
+    finished = pyqtSignal(object, str)  # tracing job, report path
+    error = pyqtSignal(object, str)
 
-    def __init__(self, mic_path, sys_path):
+    def __init__(self, mic_path, sys_path, job=None, live=None):
         super().__init__()
         self.mic_path = mic_path
         self.sys_path = sys_path
-        self.transcriber = ConferenceTranscriber()
+        self.job = job
+        # LiveConferenceTranscriber that already wrote most of the report during the call
+        self.live = live
+        self.transcriber = None if live else ConferenceTranscriber()
+
+    def run(self):
+        with tracing.activate(self.job):
+            tracing.end("thread_start")
+            try:
+                language = Config.get_language()
+                print("Processing Conference Session...")
+                if self.live:
+                    # Only the last window of each track is left
+                    with tracing.span("live_finish"):
+                        report_path = self.live.finish()
+                else:
+                    with tracing.span("transcribe"):
+                        segments = self.transcriber.transcribe_session(self.mic_path, self.sys_path, language)
+
+                    with tracing.span("report"):
+                        report_path = ReportGenerator.generate_markdown(segments)
+                tracing.begin("signal_delivery")
+                self.finished.emit(self.job, report_path)
+            except Exception as e:
+                self.error.emit(self.job, str(e))
+
+class ModelWarmupThread(QThread):
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
 
     def run(self):
         try:
-            language = Config.get_language()
-            print("Processing Conference Session...")
-            segments = self.transcriber.transcribe_session(self.mic_path, self.sys_path, language)
-            
-            report_path = ReportGenerator.generate_markdown(segments)
-            self.finished.emit(report_path)
+            if not Config.get_tuned_compute_type():
+                self.calibrate()
+            # Conference shares this model unless it has its own size, which loads on first use
+            print("Warming up model...")
+            Transcriber.warm_up()
+            self.finished.emit()
         except Exception as e:
             self.error.emit(str(e))
 
+    def calibrate(self):
+        # One-time quick probe before the first warm-up; the timed sweep is the Recalibrate button.
+        # Defaults still work if it fails.
+        print("Probing hardware (one-time)...")
+        try:
+            quick_probe()
+        except Exception as e:
+            print(f"Hardware probe failed, using defaults: {e}")
+
 class MainWindow(QMainWindow):
     request_start = pyqtSignal()
     request_stop = pyqtSignal()
@@ -114,13 +207,27 @@ class MainWindow(QMainWindow):
         self.recorder = AudioRecorder()
         self.conf_recorder = ConferenceRecorder()
         self.sys_recorder = SystemRecorder()
+        self.streamer = None
+        self.live_conf = None
         self.is_recording = False
+
+        # Dictation/interview jobs queue up here; conference sessions get their own thread
+        self.pipeline = TranscriptionPipeline()
+        self.pipeline.finished.connect(self.on_process_finished)
+        self.pipeline.error.connect(self.on_process_error)
+        self.conf_worker = None
         
         self.init_ui()
         self.apply_transparency()
         
+        self.warmup_thread = None
+        self.warmup_pending = False
+        self.start_warmup()
+        
         self.hotkey_manager = None
         self.setup_hotkey()
+        Config.subscribe(self.on_config_changed)
+        self.apply_standby()
 
         self.request_start.connect(self.start_recording)
         self.request_stop.connect(self.stop_recording)
@@ -135,6 +242,14 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("Ready")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.status_label)
+
+        # Last job latency (optional), per-stage breakdown in the tooltip
+        self.timing_label = QLabel("")
+        self.timing_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.timing_label.setStyleSheet("color: #777777; font-size: 10px;")
+        self.timing_label.setVisible(Config.get_trace_overlay())
+        layout.addWidget(self.timing_label)
+        tracing.add_listener(self.on_job_traced)
         
         # Main Record Button
         self.record_btn = QPushButton("🎙️")
@@ -253,6 +368,23 @@ class MainWindow(QMainWindow):
             self.stealth_hotkey_manager = HotkeyManager(stealth_key, self.toggle_stealth)
             self.stealth_hotkey_manager.start()
 
+    def on_config_changed(self, changed):
+        # Only re-wire what actually changed; restarting the hotkey listeners drops key state
+        if changed & {"GLOBAL_HOTKEY", "STEALTH_HOTKEY"}:
+            self.setup_hotkey()
+        if "WINDOW_TRANSPARENCY" in changed:
+            self.apply_transparency()
+        if "TRACE_OVERLAY" in changed:
+            self.timing_label.setVisible(Config.get_trace_overlay())
+        if "STANDBY_CAPTURE" in changed:
+            self.apply_standby()
+
+    def apply_standby(self):
+        if Config.get_standby_capture():
+            self.recorder.start_standby()
+        else:
+            self.recorder.stop_standby()
+
     def on_hotkey_triggered(self):
         if self.is_recording:
             self.request_stop.emit()
@@ -276,10 +408,18 @@ class MainWindow(QMainWindow):
         mode = self.mode_combo.currentText()
         
         if "Dictation" in mode:
+            if Config.get_streaming_dictation() and Config.get_transcriber_backend() == "local":
+                self.streamer = StreamingTranscriber(language=Config.get_language())
+                self.streamer.start()
+                self.recorder.chunk_callback = self.streamer.feed
             self.recorder.start_recording()
         elif "Interview" in mode:
             self.sys_recorder.start_recording()
         elif "Conference" in mode:
+            if Config.get_live_conference() and Config.get_transcriber_backend() == "local":
+                self.live_conf = LiveConferenceTranscriber(language=Config.get_language())
+                self.live_conf.start()
+                self.conf_recorder.chunk_callback = self.live_conf.feed
             self.conf_recorder.start_recording()
 
     def stop_recording(self):
@@ -288,35 +428,49 @@ class MainWindow(QMainWindow):
         self.is_recording = False
         self.record_btn.setStyleSheet(Styles.RECORD_BUTTON_IDLE)
         self.status_label.setText("Processing...")
-        self.record_btn.setEnabled(False) 
         self.mode_combo.setEnabled(True)
         
         mode = self.mode_combo.currentText()
+        # Latency is measured from the stop press to the result reaching the UI
+        job = tracing.start_job(mode.split()[0].lower())
         
         if "Dictation" in mode:
-            audio_file = self.recorder.stop_recording()
-            self.worker = AudioProcessingThread(audio_file)
-            self.worker.finished.connect(self.on_process_finished)
+            with tracing.activate(job), tracing.span("stop_capture"):
+                audio = self.recorder.stop_recording(to_file=False)
+            if self.streamer:
+                self.recorder.chunk_callback = None
+                self.pipeline.submit("streaming", self.streamer, job)
+                self.streamer = None
+            else:
+                self.pipeline.submit("dictation", audio, job)
             
         elif "Interview" in mode:
             # System Only -> Text -> Enter
-            audio_file = self.sys_recorder.stop_recording()
-            self.worker = InterviewProcessingThread(audio_file)
-            self.worker.finished.connect(self.on_process_finished)
+            with tracing.activate(job), tracing.span("stop_capture"):
+                audio = self.sys_recorder.stop_recording(to_file=False)
+            self.pipeline.submit("interview", audio, job)
             
         elif "Conference" in mode:
-            mic_path, sys_path = self.conf_recorder.stop_recording()
-            self.worker = ConferenceProcessingThread(mic_path, sys_path)
-            self.worker.finished.connect(self.on_conf_finished)
-            
-        self.worker.error.connect(self.on_process_error)
-        self.worker.start()
+            # A session report is a long job, wait for it before the next one
+            self.record_btn.setEnabled(False)
+            with tracing.activate(job), tracing.span("stop_capture"):
+                mic_audio, sys_audio = self.conf_recorder.stop_recording(to_file=False)
+            self.conf_recorder.chunk_callback = None
+            self.conf_worker = ConferenceProcessingThread(mic_audio, sys_audio, job, self.live_conf)
+            self.live_conf = None
+            self.conf_worker.finished.connect(self.on_conf_finished)
+            self.conf_worker.error.connect(self.on_process_error)
+            job.begin("thread_start")
+            self.conf_worker.start()
 
-    def on_process_finished(self, text):
-        self.status_label.setText("Done!")
-        self.record_btn.setEnabled(True)
+    def on_process_finished(self, job, text):
+        self.finish_trace(job)
+        pending = self.pipeline.pending
+        if not self.is_recording:
+            self.status_label.setText(f"Processing ({pending} queued)..." if pending else "Done!")
 
-    def on_conf_finished(self, report_path):
+    def on_conf_finished(self, job, report_path):
+        self.finish_trace(job)
         self.status_label.setText("Report Ready!")
         self.record_btn.setEnabled(True)
         
@@ -333,23 +487,80 @@ class MainWindow(QMainWindow):
             else:
                 subprocess.call(('xdg-open', report_path))
 
-    def on_process_error(self, err_msg):
-        self.status_label.setText("Error")
-        self.record_btn.setEnabled(True)
-        self.mode_combo.setEnabled(True)
+    def on_process_error(self, job, err_msg):
+        self.finish_trace(job, error=err_msg)
+        if job is not None and job.kind == "conference":
+            self.record_btn.setEnabled(True)
+        if not self.is_recording:
+            self.status_label.setText("Error")
+            self.mode_combo.setEnabled(True)
         QMessageBox.critical(self, "Error", f"Processing failed: {err_msg}")
 
+    def finish_trace(self, job, error=None):
+        if job:
+            job.end("signal_delivery")
+            tracing.finish_job(job, error)
+
+    def on_job_traced(self, job):
+        total, breakdown = job.summary()
+        print(f"{job.kind} job {job.id}: {total}\n{breakdown}")
+        self.timing_label.setText(f"Last job: {total}")
+        rolling = job.rolling_summary()
+        self.timing_label.setToolTip(f"{breakdown}\n\nLast {tracing.HISTORY} {job.kind} jobs:\n{rolling}"
+                                     if rolling else breakdown)
+
     def open_settings(self):
         dlg = SettingsWindow(self)
         if dlg.exec():
-            self.setup_hotkey()
-            self.apply_transparency()
+            # Hotkeys, transparency and the overlay follow through on_config_changed
+            if Config.get_transcriber_backend() == "local" and Transcriber.has_loaded_models():
+                # Build the newly selected model next to the old one and swap when ready
+                Transcriber.prefetch_local_model()
+            self.start_warmup()
+
+    def start_warmup(self):
+        if not Config.get_preload_model() or Config.get_transcriber_backend() != "local":
+            return
+        if self.warmup_thread and self.warmup_thread.isRunning():
+            # Settings changed mid warm-up, go again once this one is done
+            self.warmup_pending = True
+            return
+        
+        self.warmup_pending = False
+        self.set_idle_status("Loading model...")
+        self.warmup_thread = ModelWarmupThread()
+        self.warmup_thread.finished.connect(self.on_warmup_finished)
+        self.warmup_thread.error.connect(self.on_warmup_error)
+        self.warmup_thread.start(QThread.Priority.LowestPriority)
+
+    def on_warmup_finished(self):
+        if self.warmup_pending:
+            self.restart_warmup()
+            return
+        self.set_idle_status("Ready (model loaded)")
+
+    def on_warmup_error(self, err_msg):
+        print(f"Model warm-up failed: {err_msg}")
+        self.set_idle_status("Ready (model not loaded)")
+        if self.warmup_pending:
+            self.restart_warmup()
+
+    def restart_warmup(self):
+        # Signals are emitted from run(), let the thread actually exit first
+        self.warmup_thread.wait()
+        self.start_warmup()
+
+    def set_idle_status(self, text):
+        # Don't overwrite Recording.../Processing... with background news
+        if not self.is_recording and self.record_btn.isEnabled() and not self.pipeline.pending:
+            self.status_label.setText(text)
 
     def apply_transparency(self):
         opacity = Config.get_transparency()
         self.setWindowOpacity(opacity)
 
     def closeEvent(self, event):
+        self.recorder.stop_standby()
         if self.hotkey_manager:
             self.hotkey_manager.stop()
         if self.stealth_hotkey_manager:
@@ -1,19 +1,50 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QLineEdit, 
-                               QComboBox, QPushButton, QMessageBox, QHBoxLayout, QCheckBox, QStackedWidget, QWidget, QSlider)
-from PyQt6.QtCore import Qt
+                               QComboBox, QPushButton, QMessageBox, QHBoxLayout, QCheckBox, QStackedWidget, QWidget, QSlider, QGridLayout,
+                               QScrollArea, QFrame)
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from src.utils.config import Config
 from src.ui.styles import Styles
 from src.utils.autostart import AutostartManager
+from src.services.decoding_profiles import PROFILES
+from src.services.auto_tuner import calibrate
+
+class CalibrationThread(QThread):
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+
+    def __init__(self, model_size, parent=None):
+        super().__init__(parent)
+        self.model_size = model_size
+
+    def run(self):
+        try:
+            self.finished.emit(calibrate(self.model_size, progress=self.progress.emit))
+        except Exception as e:
+            self.error.emit(str(e))
 
 class SettingsWindow(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
-        self.setFixedSize(400, 500)
+        # Fits 768 px screens; the options scroll, the buttons stay visible
+        self.setFixedWidth(420)
+        self.resize(420, 640)
+        self.setMinimumHeight(360)
         self.setStyleSheet(Styles.SETTINGS_WINDOW)
-        
+
+        outer_layout = QVBoxLayout()
+        self.setLayout(outer_layout)
+
+        content = QWidget()
         self.layout = QVBoxLayout()
-        self.setLayout(self.layout)
+        content.setLayout(self.layout)
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setFrameShape(QFrame.Shape.NoFrame)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        scroll.setWidget(content)
+        outer_layout.addWidget(scroll)
         
         # Backend Selection
         self.layout.addWidget(QLabel("Transcriber Backend:"))
@@ -50,11 +81,63 @@ class SettingsWindow(QDialog):
         self.model_size_combo.addItems(["tiny", "base", "small", "medium", "large"])
         self.model_size_combo.setCurrentText(Config.get_local_model_size())
         page_local_layout.addWidget(self.model_size_combo)
+
+        page_local_layout.addWidget(QLabel("Conference Model Size:"))
+        self.conf_model_combo = QComboBox()
+        self.conf_model_combo.addItems(["Same as above", "tiny", "base", "small", "medium", "large"])
+        self.conf_model_combo.setCurrentText(Config.get_conference_model_size() or "Same as above")
+        page_local_layout.addWidget(self.conf_model_combo)
+
+        # Decoding profile per mode: speed vs accuracy
+        page_local_layout.addWidget(QLabel("Decoding Profile:"))
+        profile_grid = QGridLayout()
+        self.profile_combos = {}
+        current_profiles = {
+            "Dictation": Config.get_dictation_profile(),
+            "Interview": Config.get_interview_profile(),
+            "Conference": Config.get_conference_profile(),
+        }
+        for col, (mode, current) in enumerate(current_profiles.items()):
+            combo = QComboBox()
+            combo.addItems(list(PROFILES))
+            combo.setCurrentText(current)
+            profile_grid.addWidget(QLabel(mode), 0, col)
+            profile_grid.addWidget(combo, 1, col)
+            self.profile_combos[mode] = combo
+        page_local_layout.addLayout(profile_grid)
         
         warning_label = QLabel("Note: First run will download the model.\n'Large' requires significant RAM/VRAM.")
         warning_label.setStyleSheet("color: #888; font-size: 11px;")
         warning_label.setWordWrap(True)
         page_local_layout.addWidget(warning_label)
+
+        self.streaming_check = QCheckBox("Transcribe dictation while recording")
+        self.streaming_check.setChecked(Config.get_streaming_dictation())
+        page_local_layout.addWidget(self.streaming_check)
+
+        self.live_conf_check = QCheckBox("Write conference report while recording")
+        self.live_conf_check.setChecked(Config.get_live_conference())
+        page_local_layout.addWidget(self.live_conf_check)
+
+        self.preload_check = QCheckBox("Preload model at startup")
+        self.preload_check.setChecked(Config.get_preload_model())
+        page_local_layout.addWidget(self.preload_check)
+
+        self.process_check = QCheckBox("Run model in a separate process")
+        self.process_check.setChecked(Config.get_inference_process())
+        page_local_layout.addWidget(self.process_check)
+
+        # Hardware calibration (device, compute type, threads)
+        calib_layout = QHBoxLayout()
+        self.calib_label = QLabel(self.calibration_text())
+        self.calib_label.setStyleSheet("color: #888; font-size: 11px;")
+        self.calib_btn = QPushButton("Recalibrate")
+        self.calib_btn.clicked.connect(self.recalibrate)
+        calib_layout.addWidget(self.calib_label)
+        calib_layout.addStretch()
+        calib_layout.addWidget(self.calib_btn)
+        page_local_layout.addLayout(calib_layout)
+        self.calib_thread = None
         
         self.page_local.setLayout(page_local_layout)
         self.backend_stack.addWidget(self.page_local)
@@ -73,6 +156,18 @@ class SettingsWindow(QDialog):
             self.lang_combo.setCurrentText(current_lang)
         self.layout.addWidget(self.lang_combo)
 
+        self.vad_check = QCheckBox("Skip silence before transcribing")
+        self.vad_check.setChecked(Config.get_vad_enabled())
+        self.layout.addWidget(self.vad_check)
+
+        self.echo_check = QCheckBox("Remove speaker echo from conference mic")
+        self.echo_check.setChecked(Config.get_echo_filter())
+        self.layout.addWidget(self.echo_check)
+
+        self.standby_check = QCheckBox("Keep microphone open for instant start")
+        self.standby_check.setChecked(Config.get_standby_capture())
+        self.layout.addWidget(self.standby_check)
+
         # Output Mode Section
         self.layout.addWidget(QLabel("Output Mode:"))
         self.cursor_check = QCheckBox("Type at Cursor")
@@ -104,6 +199,15 @@ class SettingsWindow(QDialog):
             self.autostart_check.setChecked(True)
         self.layout.addWidget(self.autostart_check)
 
+        # Latency tracing
+        self.trace_overlay_check = QCheckBox("Show last job latency")
+        self.trace_overlay_check.setChecked(Config.get_trace_overlay())
+        self.layout.addWidget(self.trace_overlay_check)
+
+        self.trace_log_check = QCheckBox("Log stage timings to file")
+        self.trace_log_check.setChecked(Config.get_trace_log_enabled())
+        self.layout.addWidget(self.trace_log_check)
+
         # Transparency Section
         self.layout.addWidget(QLabel("Window Transparency:"))
         self.transparency_layout = QHBoxLayout()
@@ -135,7 +239,33 @@ class SettingsWindow(QDialog):
         btn_layout.addWidget(self.cancel_btn)
         btn_layout.addWidget(self.save_btn)
         
-        self.layout.addLayout(btn_layout)
+        outer_layout.addLayout(btn_layout)
+
+    def calibration_text(self):
+        compute_type = Config.get_tuned_compute_type()
+        if not compute_type:
+            return "Hardware: not calibrated"
+        threads = Config.get_tuned_cpu_threads() or "auto"
+        return f"Hardware: {Config.get_tuned_device()}, {compute_type}, {threads} threads per worker"
+
+    def recalibrate(self):
+        # Runs in the background; parented to the main window so closing this dialog doesn't kill it
+        self.calib_btn.setEnabled(False)
+        self.calib_label.setText("Calibrating...")
+        self.calib_thread = CalibrationThread(self.model_size_combo.currentText(), self.parent() or self)
+        self.calib_thread.progress.connect(self.calib_label.setText)
+        self.calib_thread.finished.connect(self.on_calibration_finished)
+        self.calib_thread.error.connect(self.on_calibration_error)
+        self.calib_thread.start()
+
+    def on_calibration_finished(self, result):
+        self.calib_label.setText(self.calibration_text())
+        self.calib_btn.setEnabled(True)
+
+    def on_calibration_error(self, err_msg):
+        self.calib_label.setText("Calibration failed")
+        self.calib_btn.setEnabled(True)
+        QMessageBox.warning(self, "Calibration", f"Calibration failed: {err_msg}")
 
     def toggle_backend_ui(self):
         if self.backend_combo.currentText() == "Local Whisper":
@@ -144,35 +274,53 @@ class SettingsWindow(QDialog):
             self.backend_stack.setCurrentWidget(self.page_api)
 
     def save_settings(self):
-        # Backend
         backend = "local" if self.backend_combo.currentText() == "Local Whisper" else "openai_api"
-        Config.set_transcriber_backend(backend)
-        
-        if backend == "openai_api":
-            api_key = self.api_key_input.text().strip()
-            if not api_key:
-                QMessageBox.warning(self, "Invalid Input", "API Key cannot be empty for OpenAI backend.")
-                return
-            Config.set_openai_api_key(api_key)
-        else:
-            Config.set_local_model_size(self.model_size_combo.currentText())
+        api_key = self.api_key_input.text().strip()
+        if backend == "openai_api" and not api_key:
+            QMessageBox.warning(self, "Invalid Input", "API Key cannot be empty for OpenAI backend.")
+            return
 
-        # Common
-        Config.set_language(self.lang_combo.currentText())
-        Config.set_hotkey(self.hotkey_input.text().strip())
-        Config.set_stealth_hotkey(self.stealth_hotkey_input.text().strip())
-        
-        output_modes = []
-        if self.cursor_check.isChecked():
-            output_modes.append("cursor")
-        if self.clipboard_check.isChecked():
-            output_modes.append("clipboard")
-        Config.set_output_modes(output_modes)
+        # One .env write and one change notification for the whole dialog
+        with Config.batch():
+            # Backend
+            Config.set_transcriber_backend(backend)
+            
+            if backend == "openai_api":
+                Config.set_openai_api_key(api_key)
+            else:
+                Config.set_local_model_size(self.model_size_combo.currentText())
+                conf_model = self.conf_model_combo.currentText()
+                Config.set_conference_model_size("" if conf_model == "Same as above" else conf_model)
+                Config.set_streaming_dictation(self.streaming_check.isChecked())
+                Config.set_live_conference(self.live_conf_check.isChecked())
+                Config.set_dictation_profile(self.profile_combos["Dictation"].currentText())
+                Config.set_interview_profile(self.profile_combos["Interview"].currentText())
+                Config.set_conference_profile(self.profile_combos["Conference"].currentText())
+                Config.set_preload_model(self.preload_check.isChecked())
+                Config.set_inference_process(self.process_check.isChecked())
 
-        # Autostart
-        AutostartManager.set_autostart(self.autostart_check.isChecked())
-        
-        # Transparency
-        Config.set_transparency(self.transparency_slider.value())
+            # Common
+            Config.set_language(self.lang_combo.currentText())
+            Config.set_vad_enabled(self.vad_check.isChecked())
+            Config.set_echo_filter(self.echo_check.isChecked())
+            Config.set_standby_capture(self.standby_check.isChecked())
+            Config.set_hotkey(self.hotkey_input.text().strip())
+            Config.set_stealth_hotkey(self.stealth_hotkey_input.text().strip())
+            
+            output_modes = []
+            if self.cursor_check.isChecked():
+                output_modes.append("cursor")
+            if self.clipboard_check.isChecked():
+                output_modes.append("clipboard")
+            Config.set_output_modes(output_modes)
+
+            Config.set_trace_overlay(self.trace_overlay_check.isChecked())
+            Config.set_trace_log_enabled(self.trace_log_check.isChecked())
+
+            # Autostart
+            AutostartManager.set_autostart(self.autostart_check.isChecked())
+            
+            # Transparency
+            Config.set_transparency(self.transparency_slider.value())
         
         self.accept()
@@ -55,6 +55,9 @@ class Styles:
         QDialog {{
             background-color: {BACKGROUND_DARK};
         }}
+        QScrollArea, QScrollArea > QWidget > QWidget {{
+            background: transparent;
+        }}
         QLabel {{
             font-family: "{FONT_FAMILY}";
             color: {TEXT_WHITE};
@@ -0,0 +1,89 @@
+import io
+import math
+import numpy as np
+
+# Whisper models expect mono float32 audio at this rate
+WHISPER_SAMPLE_RATE = 16000
+
+
+def pcm16_to_float32(data):
+    # Raw little-endian int16 bytes (pyaudio) -> float32 in [-1, 1]
+    samples = np.frombuffer(data, dtype=np.int16)
+    return samples.astype(np.float32) / 32768.0
+
+
+def to_mono(audio):
+    # (frames, channels) float array -> (frames,)
+    if audio.ndim == 1:
+        return audio
+    return audio.mean(axis=1)
+
+
+class StreamResampler:
+    """
+    Polyphase FIR resampler that works chunk by chunk.
+
+    The input history and the output phase are carried across calls, so
+    resampling a stream in pieces gives the same result as resampling it in
+    one go (no clicks at chunk boundaries).
+    """
+
+    def __init__(self, src_rate, dst_rate=WHISPER_SAMPLE_RATE, half_zero_crossings=10, beta=5.0):
+        g = math.gcd(int(src_rate), int(dst_rate))
+        self.up = int(dst_rate) // g
+        self.down = int(src_rate) // g
+
+        # Windowed-sinc low-pass at the lower of the two Nyquist rates,
+        # designed at the upsampled rate (same layout as scipy's resample_poly)
+        max_rate = max(self.up, self.down)
+        half_len = half_zero_crossings * max_rate
+        n = np.arange(-half_len, half_len + 1)
+        h = np.sinc(n / max_rate) * np.kaiser(len(n), beta)
+        h *= self.up / h.sum()
+
+        # Pad to a whole number of taps per phase and split into phases:
+        # phases[p, k] = h[p + k * up]
+        taps = -(-len(h) // self.up)
+        h = np.concatenate([h, np.zeros(taps * self.up - len(h))])
+        self.phases = h.reshape(taps, self.up).T.astype(np.float32)
+        self.taps = taps
+        # Shift by the filter's group delay so the output is time-aligned
+        self.delay = half_len
+
+        self._history = np.zeros(taps - 1, dtype=np.float32)
+        self._n_in = 0
+        self._n_out = 0
+
+    def process(self, chunk):
+        chunk = np.asarray(chunk, dtype=np.float32)
+        if self.up == self.down:
+            return chunk
+        if len(chunk) == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        # x_ext[0] is global input index (n_in - len(history))
+        x_ext = np.concatenate([self._history, chunk])
+        offset = self._n_in - len(self._history)
+        total_in = self._n_in + len(chunk)
+
+        # Output n needs input index (n * down + delay) // up to be available
+        last_out = (total_in * self.up - 1 - self.delay) // self.down
+        n = np.arange(self._n_out, last_out + 1, dtype=np.int64)
+
+        pos = n * self.down + self.delay
+        idx = (pos // self.up - offset)[:, None] - np.arange(self.taps)[None, :]
+        out = np.einsum('ij,ij->i', x_ext[idx], self.phases[pos % self.up])
+
+        self._n_out += len(n)
+        self._n_in = total_in
+        self._history = x_ext[len(x_ext) - len(self._history):]
+        return out
+
+
+def encode_wav(audio, rate=WHISPER_SAMPLE_RATE):
+    # In-memory 16-bit WAV for backends that need a file upload
+    import soundfile as sf
+
+    buf = io.BytesIO()
+    sf.write(buf, audio, rate, format='WAV', subtype='PCM_16')
+    return buf.getvalue()
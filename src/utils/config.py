@@ -1,5 +1,9 @@
+import functools
 import os
-from dotenv import load_dotenv, set_key
+import tempfile
+import threading
+from contextlib import contextmanager
+from dotenv import load_dotenv
 from pathlib import Path
 
 # Load env variables from the .env file in the root directory
@@ -7,79 +11,548 @@ ROOT_DIR = Path(__file__).parent.parent.parent
 ENV_PATH = ROOT_DIR / ".env"
 load_dotenv(ENV_PATH)
 
+
+class _Settings:
+    """
+    In-memory snapshot of the settings, taken once from the environment.
+
+    Setters update the snapshot (and os.environ, for child processes) right
+    away. The .env file is rewritten atomically once per `batch()`, or once per
+    set outside a batch, and listeners are told which keys actually changed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        # load_dotenv already merged .env into the environment (real variables win)
+        self._values = dict(os.environ)
+        self._dirty = {}
+        self._batch_depth = 0
+        self._listeners = []
+        self.version = 0
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def set(self, key, value):
+        with self._lock:
+            if self._values.get(key) == value:
+                return
+            self._values[key] = value
+            os.environ[key] = value
+            self._dirty[key] = value
+            self.version += 1
+            if self._batch_depth == 0:
+                self._flush()
+
+    @contextmanager
+    def batch(self):
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._flush()
+
+    def subscribe(self, callback):
+        with self._lock:
+            self._listeners.append(callback)
+
+    def values(self, keys):
+        return {key: self._values[key] for key in keys if key in self._values}
+
+    def update(self, values):
+        # Values another process already saved: snapshot only, no write, no listeners
+        with self._lock:
+            self._values.update(values)
+            os.environ.update(values)
+            self.version += 1
+
+    def _flush(self):
+        if not self._dirty:
+            return
+        changed, self._dirty = self._dirty, {}
+        try:
+            self._write(changed)
+        except OSError as e:
+            print(f"Failed to save settings: {e}")
+
+        for callback in list(self._listeners):
+            try:
+                callback(set(changed))
+            except Exception as e:
+                print(f"Settings listener failed: {e}")
+
+    def _write(self, changed):
+        # Rewrite only the changed lines, keep everything else (comments, order) as is
+        path = Path(self.path)
+        lines = path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+        remaining = dict(changed)
+        for i, line in enumerate(lines):
+            key = line.strip().removeprefix("export ").split("=", 1)[0].strip()
+            if "=" in line and key in remaining:
+                lines[i] = self._format(key, remaining.pop(key))
+        lines.extend(self._format(k, v) for k, v in remaining.items())
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".env.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    @staticmethod
+    def _format(key, value):
+        # Same quoting as dotenv's set_key
+        return "{}='{}'".format(key, value.replace("'", "\\'"))
+
+
+_settings = _Settings(ENV_PATH)
+_parsed = {}
+
+
+def _cached(getter):
+    # Getters parse their value once per settings version
+    @functools.wraps(getter)
+    def wrapper():
+        version = _settings.version
+        hit = _parsed.get(getter.__name__)
+        if hit is not None and hit[0] == version:
+            value = hit[1]
+        else:
+            value = getter()
+            _parsed[getter.__name__] = (version, value)
+        return list(value) if isinstance(value, list) else value
+    return wrapper
+
+
 class Config:
     @staticmethod
+    def batch():
+        # Group several setters into one .env write and one change notification
+        return _settings.batch()
+
+    @staticmethod
+    def subscribe(callback):
+        # callback(changed_keys) runs on the thread that saved the settings
+        _settings.subscribe(callback)
+
+    @staticmethod
+    def values(keys):
+        # Raw values of `keys`, to hand to another process
+        return _settings.values(keys)
+
+    @staticmethod
+    def update(values):
+        # Takes over values saved by another process (the inference worker's copy of the UI settings)
+        _settings.update(values)
+
+    @staticmethod
+    @_cached
     def get_openai_api_key():
-        return os.getenv("OPENAI_API_KEY")
+        return _settings.get("OPENAI_API_KEY")
 
     @staticmethod
     def set_openai_api_key(key):
-        os.environ["OPENAI_API_KEY"] = key
-        set_key(ENV_PATH, "OPENAI_API_KEY", key)
+        _settings.set("OPENAI_API_KEY", key)
+
+    @staticmethod
+    @_cached
+    def get_openai_base_url():
+        # Optional override for the API endpoint (proxies, local stub servers)
+        return _settings.get("OPENAI_BASE_URL", "")
 
     @staticmethod
+    def set_openai_base_url(url):
+        _settings.set("OPENAI_BASE_URL", url)
+
+    @staticmethod
+    @_cached
+    def get_api_chunk_seconds():
+        # Longer recordings are split into pieces of at most this length for the API
+        # (16 kHz 16-bit WAV is ~1.9 MB per minute, the upload limit is 25 MB)
+        val = _settings.get("API_CHUNK_SECONDS", "300")
+        try:
+            return min(720, max(30, int(val)))
+        except ValueError:
+            return 300
+
+    @staticmethod
+    def set_api_chunk_seconds(seconds):
+        val = str(min(720, max(30, int(seconds))))
+        _settings.set("API_CHUNK_SECONDS", val)
+
+    @staticmethod
+    @_cached
+    def get_api_parallelism():
+        # Concurrent uploads for split recordings (bounded by the connection pool)
+        val = _settings.get("API_PARALLELISM", "4")
+        try:
+            return min(8, max(1, int(val)))
+        except ValueError:
+            return 4
+
+    @staticmethod
+    def set_api_parallelism(count):
+        val = str(min(8, max(1, int(count))))
+        _settings.set("API_PARALLELISM", val)
+
+    @staticmethod
+    @_cached
     def get_output_modes():
-        mode_str = os.getenv("OUTPUT_MODE", "cursor")
+        mode_str = _settings.get("OUTPUT_MODE", "cursor")
         return mode_str.split(",") if mode_str else []
 
     @staticmethod
     def set_output_modes(modes):
         # modes is a list of strings, e.g. ['cursor', 'clipboard']
         mode_str = ",".join(modes)
-        os.environ["OUTPUT_MODE"] = mode_str
-        set_key(ENV_PATH, "OUTPUT_MODE", mode_str)
+        _settings.set("OUTPUT_MODE", mode_str)
 
     @staticmethod
+    @_cached
     def get_language():
-        return os.getenv("WHISPER_LANGUAGE", "Auto")
+        return _settings.get("WHISPER_LANGUAGE", "Auto")
 
     @staticmethod
     def set_language(lang):
-        os.environ["WHISPER_LANGUAGE"] = lang
-        set_key(ENV_PATH, "WHISPER_LANGUAGE", lang)
+        _settings.set("WHISPER_LANGUAGE", lang)
 
     @staticmethod
+    @_cached
     def get_hotkey():
-        return os.getenv("GLOBAL_HOTKEY", "<ctrl>+<alt>+s")
+        return _settings.get("GLOBAL_HOTKEY", "<ctrl>+<alt>+s")
 
     @staticmethod
     def set_hotkey(hotkey):
-        os.environ["GLOBAL_HOTKEY"] = hotkey
-        set_key(ENV_PATH, "GLOBAL_HOTKEY", hotkey)
+        _settings.set("GLOBAL_HOTKEY", hotkey)
 
     @staticmethod
+    @_cached
     def get_stealth_hotkey():
-        return os.getenv("STEALTH_HOTKEY", "<ctrl>+<alt>+h")
+        return _settings.get("STEALTH_HOTKEY", "<ctrl>+<alt>+h")
 
     @staticmethod
     def set_stealth_hotkey(hotkey):
-        os.environ["STEALTH_HOTKEY"] = hotkey
-        set_key(ENV_PATH, "STEALTH_HOTKEY", hotkey)
+        _settings.set("STEALTH_HOTKEY", hotkey)
 
     @staticmethod
+    @_cached
     def get_transcriber_backend():
         # 'openai_api' or 'local'
-        return os.getenv("TRANSCRIBER_BACKEND", "openai_api")
+        return _settings.get("TRANSCRIBER_BACKEND", "openai_api")
 
     @staticmethod
     def set_transcriber_backend(backend):
-        os.environ["TRANSCRIBER_BACKEND"] = backend
-        set_key(ENV_PATH, "TRANSCRIBER_BACKEND", backend)
+        _settings.set("TRANSCRIBER_BACKEND", backend)
 
     @staticmethod
+    @_cached
     def get_local_model_size():
         # 'tiny', 'base', 'small', 'medium', 'large'
-        return os.getenv("LOCAL_MODEL_SIZE", "base")
+        return _settings.get("LOCAL_MODEL_SIZE", "base")
 
     @staticmethod
     def set_local_model_size(size):
-        os.environ["LOCAL_MODEL_SIZE"] = size
-        set_key(ENV_PATH, "LOCAL_MODEL_SIZE", size)
+        _settings.set("LOCAL_MODEL_SIZE", size)
+
+    @staticmethod
+    @_cached
+    def get_dictation_profile():
+        # Decoding profile: 'fastest', 'balanced', 'accurate'
+        return _settings.get("DICTATION_PROFILE", "fastest")
+
+    @staticmethod
+    def set_dictation_profile(profile):
+        _settings.set("DICTATION_PROFILE", profile)
+
+    @staticmethod
+    @_cached
+    def get_interview_profile():
+        return _settings.get("INTERVIEW_PROFILE", "fastest")
+
+    @staticmethod
+    def set_interview_profile(profile):
+        _settings.set("INTERVIEW_PROFILE", profile)
+
+    @staticmethod
+    @_cached
+    def get_conference_profile():
+        return _settings.get("CONFERENCE_PROFILE", "accurate")
+
+    @staticmethod
+    def set_conference_profile(profile):
+        _settings.set("CONFERENCE_PROFILE", profile)
+
+    @staticmethod
+    @_cached
+    def get_live_conference():
+        # Transcribe conference tracks and write the report while recording (local backend only)
+        return _settings.get("LIVE_CONFERENCE", "false").lower() == "true"
+
+    @staticmethod
+    def set_live_conference(enabled):
+        val = "true" if enabled else "false"
+        _settings.set("LIVE_CONFERENCE", val)
+
+    @staticmethod
+    @_cached
+    def get_streaming_dictation():
+        # Transcribe dictation while recording (local backend only)
+        return _settings.get("STREAMING_DICTATION", "false").lower() == "true"
+
+    @staticmethod
+    def set_streaming_dictation(enabled):
+        val = "true" if enabled else "false"
+        _settings.set("STREAMING_DICTATION", val)
+
+    @staticmethod
+    @_cached
+    def get_echo_filter():
+        # Skip speaker echo in the conference mic track and drop duplicated lines
+        return _settings.get("ECHO_FILTER", "true").lower() == "true"
+
+    @staticmethod
+    def set_echo_filter(enabled):
+        val = "true" if enabled else "false"
+        _settings.set("ECHO_FILTER", val)
+
+    @staticmethod
+    @_cached
+    def get_vad_enabled():
+        # Cut silence out of recordings before transcribing
+        return _settings.get("VAD_ENABLED", "true").lower() == "true"
+
+    @staticmethod
+    def set_vad_enabled(enabled):
+        val = "true" if enabled else "false"
+        _settings.set("VAD_ENABLED", val)
+
+    @staticmethod
+    @_cached
+    def get_long_form_batch_size():
+        # Chunks decoded together for long local transcriptions, < 2 disables batching
+        val = _settings.get("LONG_FORM_BATCH_SIZE", "8")
+        try:
+            return max(0, int(val))
+        except ValueError:
+            return 8
+
+    @staticmethod
+    def set_long_form_batch_size(size):
+        val = str(max(0, int(size)))
+        _settings.set("LONG_FORM_BATCH_SIZE", val)
+
+    @staticmethod
+    @_cached
+    def get_long_form_min_seconds():
+        # Recordings at least this long (after silence trimming) use batched decoding
+        val = _settings.get("LONG_FORM_MIN_SECONDS", "120")
+        try:
+            return max(30, int(val))
+        except ValueError:
+            return 120
+
+    @staticmethod
+    def set_long_form_min_seconds(seconds):
+        val = str(max(30, int(seconds)))
+        _settings.set("LONG_FORM_MIN_SECONDS", val)
+
+    @staticmethod
+    @_cached
+    def get_result_cache_enabled():
+        # Reuse transcriptions of identical audio with identical settings
+        return _settings.get("RESULT_CACHE_ENABLED", "true").lower() == "true"
+
+    @staticmethod
+    def set_result_cache_enabled(enabled):
+        val = "true" if enabled else "false"
+        _settings.set("RESULT_CACHE_ENABLED", val)
+
+    @staticmethod
+    @_cached
+    def get_result_cache_mb():
+        val = _settings.get("RESULT_CACHE_MB", "50")
+        try:
+            return max(1, int(val))
+        except ValueError:
+            return 50
+
+    @staticmethod
+    def set_result_cache_mb(mb):
+        val = str(max(1, int(mb)))
+        _settings.set("RESULT_CACHE_MB", val)
+
+    @staticmethod
+    @_cached
+    def get_preload_model():
+        # Load and warm up the local model in the background at startup
+        return _settings.get("PRELOAD_MODEL", "false").lower() == "true"
+
+    @staticmethod
+    def set_preload_model(enabled):
+        val = "true" if enabled else "false"
+        _settings.set("PRELOAD_MODEL", val)
+
+    @staticmethod
+    @_cached
+    def get_inference_process():
+        # Run local decoding in a separate worker process (isolates native crashes from the UI)
+        return _settings.get("INFERENCE_PROCESS", "false").lower() == "true"
+
+    @staticmethod
+    def set_inference_process(enabled):
+        val = "true" if enabled else "false"
+        _settings.set("INFERENCE_PROCESS", val)
+
+    @staticmethod
+    @_cached
+    def get_standby_capture():
+        # Keep the mic stream open so dictation starts instantly with pre-roll audio
+        return _settings.get("STANDBY_CAPTURE", "false").lower() == "true"
+
+    @staticmethod
+    def set_standby_capture(enabled):
+        val = "true" if enabled else "false"
+        _settings.set("STANDBY_CAPTURE", val)
+
+    @staticmethod
+    @_cached
+    def get_preroll_ms():
+        # Audio from before the hotkey press included in standby recordings
+        val = _settings.get("PREROLL_MS", "1000")
+        try:
+            return min(3000, max(0, int(val)))
+        except ValueError:
+            return 1000
+
+    @staticmethod
+    def set_preroll_ms(ms):
+        val = str(min(3000, max(0, int(ms))))
+        _settings.set("PREROLL_MS", val)
+
+    @staticmethod
+    @_cached
+    def get_capture_ram_minutes():
+        # Audio kept in RAM per recorded track, older audio spills to a temp file
+        val = _settings.get("CAPTURE_RAM_MINUTES", "10")
+        try:
+            return max(1, int(val))
+        except ValueError:
+            return 10
+
+    @staticmethod
+    def set_capture_ram_minutes(minutes):
+        val = str(max(1, int(minutes)))
+        _settings.set("CAPTURE_RAM_MINUTES", val)
+
+    @staticmethod
+    @_cached
+    def get_conference_model_size():
+        # Model used for conference reports, empty means LOCAL_MODEL_SIZE
+        return _settings.get("CONFERENCE_MODEL_SIZE", "")
+
+    @staticmethod
+    def set_conference_model_size(size):
+        _settings.set("CONFERENCE_MODEL_SIZE", size)
+
+    @staticmethod
+    @_cached
+    def get_model_cache_mb():
+        # Memory budget for loaded local models
+        val = _settings.get("MODEL_CACHE_MB", "4096")
+        try:
+            return max(1, int(val))
+        except ValueError:
+            return 4096
+
+    @staticmethod
+    def set_model_cache_mb(mb):
+        val = str(max(1, int(mb)))
+        _settings.set("MODEL_CACHE_MB", val)
+
+    @staticmethod
+    @_cached
+    def get_model_idle_minutes():
+        # Unload models unused for this long, 0 keeps them loaded
+        val = _settings.get("MODEL_IDLE_MINUTES", "30")
+        try:
+            return max(0, int(val))
+        except ValueError:
+            return 30
+
+    @staticmethod
+    def set_model_idle_minutes(minutes):
+        val = str(max(0, int(minutes)))
+        _settings.set("MODEL_IDLE_MINUTES", val)
+
+    @staticmethod
+    @_cached
+    def get_tuned_device():
+        # Written by hardware calibration; empty means not calibrated yet
+        return _settings.get("TUNED_DEVICE", "")
+
+    @staticmethod
+    def set_tuned_device(device):
+        _settings.set("TUNED_DEVICE", device)
+
+    @staticmethod
+    @_cached
+    def get_tuned_compute_type():
+        return _settings.get("TUNED_COMPUTE_TYPE", "")
+
+    @staticmethod
+    def set_tuned_compute_type(compute_type):
+        _settings.set("TUNED_COMPUTE_TYPE", compute_type)
+
+    @staticmethod
+    @_cached
+    def get_tuned_cpu_threads():
+        # Per worker of the shared model (each runs its own decode); 0 = CTranslate2 default
+        val = _settings.get("TUNED_CPU_THREADS", "0")
+        try:
+            return max(0, int(val))
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def set_tuned_cpu_threads(threads):
+        val = str(max(0, int(threads)))
+        _settings.set("TUNED_CPU_THREADS", val)
+
+    @staticmethod
+    @_cached
+    def get_trace_log_enabled():
+        # Append per-stage timings of every job to a JSON-lines file in the temp dir
+        return _settings.get("TRACE_LOG", "false").lower() == "true"
+
+    @staticmethod
+    def set_trace_log_enabled(enabled):
+        val = "true" if enabled else "false"
+        _settings.set("TRACE_LOG", val)
+
+    @staticmethod
+    @_cached
+    def get_trace_overlay():
+        # Show the last job's latency under the record button
+        return _settings.get("TRACE_OVERLAY", "false").lower() == "true"
+
+    @staticmethod
+    def set_trace_overlay(enabled):
+        val = "true" if enabled else "false"
+        _settings.set("TRACE_OVERLAY", val)
 
     @staticmethod
+    @_cached
     def get_transparency():
         # Returns float 0.1 to 1.0, default 1.0 (Opaque)
-        val = os.getenv("WINDOW_TRANSPARENCY", "100")
+        val = _settings.get("WINDOW_TRANSPARENCY", "100")
         try:
             return float(val) / 100.0
         except:
@@ -89,5 +562,4 @@ class Config:
     def set_transparency(percent_int):
         # Stores as integer 10-100
         val = str(max(10, min(100, int(percent_int))))
-        os.environ["WINDOW_TRANSPARENCY"] = val
-        set_key(ENV_PATH, "WINDOW_TRANSPARENCY", val)
+        _settings.set("WINDOW_TRANSPARENCY", val)
@@ -0,0 +1,78 @@
+import builtins
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile:
+    """
+    Wall-clock breakdown of application startup for --startup-profile.
+
+    Phases are timed explicitly by main.py. Imports are timed by wrapping
+    builtins.__import__: every module that is actually loaded (not already in
+    sys.modules) is recorded with its inclusive time and nesting depth, like
+    `python -X importtime` but without restarting the interpreter.
+    """
+
+    def __init__(self, min_import_ms=5.0):
+        self.t0 = time.perf_counter()
+        self.min_import_ms = min_import_ms
+        self.phases = []  # (label, start_ms, duration_ms)
+        self.imports = []  # [depth, name, ms], in start order
+        self._local = threading.local()
+        self._real_import = None
+
+    def now_ms(self):
+        return (time.perf_counter() - self.t0) * 1000
+
+    @contextmanager
+    def phase(self, label):
+        start = self.now_ms()
+        try:
+            yield
+        finally:
+            self.phases.append((label, start, self.now_ms() - start))
+
+    def mark(self, label):
+        self.phases.append((label, self.now_ms(), 0.0))
+
+    def track_imports(self):
+        if self._real_import is None:
+            self._real_import = builtins.__import__
+            builtins.__import__ = self._import
+
+    def stop_tracking(self):
+        if self._real_import is not None:
+            builtins.__import__ = self._real_import
+            self._real_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules or threading.current_thread() is not threading.main_thread():
+            return self._real_import(name, globals, locals, fromlist, level)
+
+        depth = getattr(self._local, "depth", 0)
+        entry = [depth, name, 0.0]
+        self.imports.append(entry)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            return self._real_import(name, globals, locals, fromlist, level)
+        finally:
+            entry[2] = (time.perf_counter() - start) * 1000
+            self._local.depth = depth
+
+    def report(self):
+        lines = ["", "Startup profile", "-" * 50]
+        for label, start, duration in self.phases:
+            if duration:
+                lines.append(f"{start:8.1f} ms  {label:<28} {duration:8.1f} ms")
+            else:
+                lines.append(f"{start:8.1f} ms  {label}")
+
+        slow = [e for e in self.imports if e[2] >= self.min_import_ms]
+        if slow:
+            lines += ["", f"Imports over {self.min_import_ms:g} ms (inclusive)", "-" * 50]
+            for depth, name, ms in slow:
+                lines.append(f"{ms:8.1f} ms  {'  ' * depth}{name}")
+        print("\n".join(lines), flush=True)
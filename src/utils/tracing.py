@@ -0,0 +1,231 @@
+import itertools
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+
+from src.utils.config import Config
+
+# Samples kept per stage for the rolling percentiles
+HISTORY = 200
+
+_local = threading.local()
+_lock = threading.Lock()
+_ids = itertools.count(1)
+_histograms = {}
+_listeners = []
+
+
+class Job:
+    """
+    Stage timings for one unit of work (one dictation, one conference report...).
+
+    Events are (stage, start, end, depth) with monotonic times in seconds;
+    instant marks have start == end. The job is made current on whichever
+    thread is working on it with `activate`, so services can record stages
+    through the module-level `span`/`mark` without being handed the job.
+    """
+
+    def __init__(self, kind):
+        self.id = next(_ids)
+        self.kind = kind
+        self.started = time.monotonic()
+        self.wall_time = time.time()
+        self.events = []
+        self._open = {}
+        self.error = None
+        self.finished = None
+        self.rolling = {}  # percentiles of this kind of job, including this one, set by finish_job
+
+    def mark(self, stage):
+        now = time.monotonic()
+        self.events.append((stage, now, now, _depth()))
+
+    @contextmanager
+    def span(self, stage):
+        depth = _depth()
+        _local.depth = depth + 1
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            _local.depth = depth
+            self.events.append((stage, start, time.monotonic(), depth))
+
+    def begin(self, stage):
+        # For stages that start on one thread and end on another (thread start, signal delivery)
+        self._open[stage] = time.monotonic()
+
+    def end(self, stage):
+        start = self._open.pop(stage, None)
+        if start is not None:
+            self.events.append((stage, start, time.monotonic(), _depth()))
+
+    def total_ms(self):
+        end = self.finished or time.monotonic()
+        return (end - self.started) * 1000
+
+    def stages(self):
+        # Milliseconds per stage (summed if a stage ran more than once), in order of first start
+        totals = {}
+        for stage, start, end, depth in sorted(self.events, key=lambda e: e[1]):
+            totals[stage] = totals.get(stage, 0.0) + (end - start) * 1000
+        return totals
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "time": self.wall_time,
+            "total_ms": round(self.total_ms(), 2),
+            "error": self.error,
+            "rolling": {stage: {q: round(v, 2) for q, v in ps.items()} for stage, ps in self.rolling.items()},
+            "events": [
+                {"stage": stage, "start_ms": round((start - self.started) * 1000, 2),
+                 "duration_ms": round((end - start) * 1000, 2), "depth": depth}
+                for stage, start, end, depth in sorted(self.events, key=lambda e: e[1])
+            ],
+        }
+
+    def summary(self):
+        # "812 ms" plus one "stage: ms" line per nested stage, for tooltips and logs
+        lines = [f"{'  ' * depth}{stage}: {(end - start) * 1000:.0f} ms"
+                 for stage, start, end, depth in sorted(self.events, key=lambda e: e[1]) if end > start]
+        return f"{self.total_ms():.0f} ms", "\n".join(lines)
+
+    def rolling_summary(self):
+        # "total: p50 640 ms, p95 1210 ms" per stage, over the last HISTORY jobs of this kind
+        return "\n".join(f"{stage}: " + ", ".join(f"{q} {v:.0f} ms" for q, v in ps.items())
+                         for stage, ps in self.rolling.items())
+
+
+class Histogram:
+    """Rolling window of the last HISTORY durations of one stage, in ms."""
+
+    def __init__(self):
+        self.samples = deque(maxlen=HISTORY)
+
+    def add(self, ms):
+        self.samples.append(ms)
+
+    def percentiles(self, qs=(50, 95)):
+        if not self.samples:
+            return {}
+        values = np.percentile(np.fromiter(self.samples, dtype=np.float64), qs)
+        return {f"p{q}": float(v) for q, v in zip(qs, values)}
+
+
+def _depth():
+    return getattr(_local, "depth", 0)
+
+
+def start_job(kind):
+    return Job(kind)
+
+
+def current():
+    return getattr(_local, "job", None)
+
+
+@contextmanager
+def activate(job):
+    # Make `job` the current job of this thread for the duration of the block
+    previous = current()
+    previous_depth = _depth()
+    _local.job = job
+    _local.depth = 0
+    try:
+        yield job
+    finally:
+        _local.job = previous
+        _local.depth = previous_depth
+
+
+def span(stage):
+    # No-op outside a job, so traced code also runs untouched from scripts and other threads
+    job = current()
+    return job.span(stage) if job else nullcontext()
+
+
+def mark(stage):
+    job = current()
+    if job:
+        job.mark(stage)
+
+
+def begin(stage):
+    job = current()
+    if job:
+        job.begin(stage)
+
+
+def end(stage):
+    job = current()
+    if job:
+        job.end(stage)
+
+
+def finish_job(job, error=None):
+    if job is None or job.finished:
+        return
+    job.finished = time.monotonic()
+    job.error = error
+
+    with _lock:
+        _histogram(f"{job.kind}.total").add(job.total_ms())
+        for stage, ms in job.stages().items():
+            _histogram(f"{job.kind}.{stage}").add(ms)
+        job.rolling = _percentiles(f"{job.kind}.")
+        listeners = list(_listeners)
+
+    if Config.get_trace_log_enabled():
+        _write_log(job)
+
+    for listener in listeners:
+        try:
+            listener(job)
+        except Exception as e:
+            print(f"Trace listener failed: {e}")
+
+
+def add_listener(callback):
+    # callback(job) runs on the thread that finishes the job
+    with _lock:
+        _listeners.append(callback)
+
+
+def percentiles(kind=None):
+    # {"dictation.decode": {"p50": ..., "p95": ...}, ...}, or {"decode": ...} for one kind
+    with _lock:
+        if kind:
+            return _percentiles(f"{kind}.")
+        return {name: h.percentiles() for name, h in _histograms.items()}
+
+
+def _percentiles(prefix):
+    # Caller holds _lock
+    return {name[len(prefix):]: h.percentiles() for name, h in _histograms.items() if name.startswith(prefix)}
+
+
+def log_path():
+    return os.path.join(tempfile.gettempdir(), "whispertyping_trace.jsonl")
+
+
+def _histogram(name):
+    h = _histograms.get(name)
+    if h is None:
+        h = _histograms[name] = Histogram()
+    return h
+
+
+def _write_log(job):
+    try:
+        with _lock, open(log_path(), "a", encoding="utf-8") as f:
+            f.write(json.dumps(job.to_dict()) + "\n")
+    except OSError as e:
+        print(f"Trace log write failed: {e}")